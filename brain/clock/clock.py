@@ -12,6 +12,9 @@ class Clock(Protocol):
     def now(self) -> datetime:
         """Return the current time."""
 
+    def now_ns(self) -> int:
+        """Return the current time as integer nanoseconds since the Unix epoch."""
+
     def sleep(self, seconds: float) -> None:
         """Advance time by the given seconds (or sleep in real time)."""
 
@@ -12,6 +12,9 @@ class RealClock:
     def now(self) -> datetime:
         return datetime.now(timezone.utc)
 
+    def now_ns(self) -> int:
+        return time.time_ns()
+
     def sleep(self, seconds: float) -> None:
         if seconds <= 0:
             return
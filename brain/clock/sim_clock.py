@@ -4,9 +4,27 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+_NS_PER_SECOND = 1_000_000_000
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def advance_ns(current_ns: int, dt_seconds: float, scale: float, n: int) -> int:
+    """Return `current_ns` advanced by `n` steps of `dt_seconds * scale`.
+
+    Each step is rounded to whole nanoseconds exactly as a single
+    `SimClock.sleep` call would, so the result matches `n` sequential calls.
+    """
+    if n <= 0 or dt_seconds <= 0:
+        return current_ns
+    return current_ns + n * round(dt_seconds * scale * _NS_PER_SECOND)
+
 
 class SimClock:
-    """Clock that advances logical time by a scale factor."""
+    """Clock that advances logical time by a scale factor.
+
+    Elapsed time is tracked as an integer nanosecond offset from the start
+    time; a `datetime` is only built when `now()` is asked for one.
+    """
 
     def __init__(
         self,
@@ -20,22 +38,43 @@ class SimClock:
         if start_time.tzinfo is None:
             raise ValueError("start_time must be timezone-aware")
         self._time_scale = time_scale
-        self._current_time = start_time
+        self._start_time = start_time
+        self._start_ns = (start_time - _EPOCH) // timedelta(microseconds=1) * 1000
+        self._elapsed_ns = 0
+        self._current_time: datetime | None = start_time
 
     @property
     def time_scale(self) -> float:
         return self._time_scale
 
     def now(self) -> datetime:
-        return self._current_time
+        current = self._current_time
+        if current is None:
+            # Round to the nearest microsecond, the resolution of datetime.
+            current = self._start_time + timedelta(
+                microseconds=(self._elapsed_ns + 500) // 1000
+            )
+            self._current_time = current
+        return current
+
+    def now_ns(self) -> int:
+        return self._start_ns + self._elapsed_ns
 
     def sleep(self, seconds: float) -> None:
         if seconds <= 0:
             return
-        advance = seconds * self._time_scale
-        self._current_time = self._current_time + timedelta(seconds=advance)
+        self._elapsed_ns += round(seconds * self._time_scale * _NS_PER_SECOND)
+        self._current_time = None
+
+    def sleep_ticks(self, seconds: float, ticks: int) -> None:
+        """Equivalent to calling `sleep(seconds)` `ticks` times."""
+        self._elapsed_ns = advance_ns(
+            self._elapsed_ns, seconds, self._time_scale, ticks
+        )
+        self._current_time = None
 
     def sleep_for_logical(self, seconds: float) -> None:
         if seconds <= 0:
             return
-        self._current_time = self._current_time + timedelta(seconds=seconds)
+        self._elapsed_ns += round(seconds * _NS_PER_SECOND)
+        self._current_time = None
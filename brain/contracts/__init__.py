@@ -5,12 +5,14 @@ These models define the source of truth for all pipeline boundaries and persiste
 All data written to JSONL must validate against these schemas.
 """
 
+from ._adapters import OBSERVATION_V1_LIST_ADAPTER
 from .action_v1 import ActionV1
 from .anomaly_v1 import AnomalyV1
 from .device_status_v1 import DeviceStatusV1
 from .executor_event_v1 import ExecutorEventV1
 from .forecast_36h_v1 import Forecast36hV1
 from .guardrail_result_v1 import GuardrailResultV1
+from .observation_batch import ObservationBatch
 from .observation_v1 import ObservationV1
 from .sampling_plan_v1 import SamplingPlanV1
 from .sensor_health_v1 import SensorHealthV1
@@ -27,6 +29,7 @@ __all__ = [
     "AnomalyV1",
     "SensorHealthV1",
     "ObservationV1",
+    "ObservationBatch",
     "DeviceStatusV1",
     "GuardrailResultV1",
     "ExecutorEventV1",
@@ -37,4 +40,6 @@ __all__ = [
     "VisionInputV1",
     "VisionV1",
     "VisionExplanationV1",
+    # Module-level list adapter, built once at import.
+    "OBSERVATION_V1_LIST_ADAPTER",
 ]
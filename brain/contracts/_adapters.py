@@ -0,0 +1,17 @@
+"""Shared TypeAdapters for contract decode paths that have a caller.
+
+Built once at import so loaders validate raw JSON bytes without rebuilding
+a core schema per call. Add an adapter here together with the loader that
+uses it; single records already decode through the model classmethods.
+
+Outbound log/explanation contracts (`WeatherAdapterLogV1`,
+`VisionExplanationV1`, `TargetsV1`, ...) keep ``defer_build=True`` and get
+their schema on first use.
+"""
+
+from pydantic import TypeAdapter
+
+from .observation_v1 import ObservationV1
+
+# Validates a whole JSON array of records in one core call.
+OBSERVATION_V1_LIST_ADAPTER = TypeAdapter(list[ObservationV1])
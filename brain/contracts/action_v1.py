@@ -1,10 +1,9 @@
 """ActionV1: Control decisions made by the Control Layer Agent."""
 
-from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class ActionType(str, Enum):
@@ -17,6 +16,9 @@ class ActionType(str, Enum):
     CIRCULATE = "circulate"
 
 
+ActionTypeValue = Literal["water", "light", "fan", "co2", "circulate"]
+
+
 class ActionV1(BaseModel):
     """
     Control decision from Control Layer Agent.
@@ -40,20 +42,20 @@ class ActionV1(BaseModel):
     """
 
     model_config = ConfigDict(
-        use_enum_values=True,
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["action_v1"] = Field(
         description="Schema version identifier. Must be 'action_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when action was decided."
     )
 
     # Action definition
-    action_type: ActionType = Field(
+    action_type: ActionTypeValue = Field(
         description="Type of control action (water, light, fan, co2, circulate)."
     )
     duration_seconds: Optional[float] = Field(
@@ -112,22 +114,13 @@ class ActionV1(BaseModel):
         ),
     )
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
     @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'action_v1'."""
-        if v != "action_v1":
-            raise ValueError(
-                f"schema_version must be 'action_v1', got '{v}'"
-            )
-        return v
+    def build_trusted(cls, **data: object) -> "ActionV1":
+        """Build an ActionV1 from values an internal producer already constrained.
+
+        Skips validation via ``model_construct``. Callers must pass
+        ``schema_version="action_v1"``, an aware ``timestamp``, plain string
+        enum values (``ActionType.WATER.value``) and in-range numeric fields.
+        Anything crossing an external boundary must use ``ActionV1(...)``.
+        """
+        return cls.model_construct(**data)
@@ -1,10 +1,9 @@
 """AnomalyV1: Detected anomalies with severity and context."""
 
-from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class SeverityLevel(str, Enum):
@@ -16,6 +15,9 @@ class SeverityLevel(str, Enum):
     CRITICAL = "critical"
 
 
+SeverityLevelValue = Literal["low", "medium", "high", "critical"]
+
+
 class AnomalyType(str, Enum):
     """Types of detectable anomalies."""
 
@@ -32,6 +34,21 @@ class AnomalyType(str, Enum):
     UNKNOWN = "unknown"
 
 
+AnomalyTypeValue = Literal[
+    "sensor_disconnect",
+    "sensor_stuck",
+    "sensor_drift",
+    "sensor_jump",
+    "moisture_stress",
+    "temperature_stress",
+    "vpd_out_of_range",
+    "device_offline",
+    "mcu_reset",
+    "wind_spike",
+    "unknown",
+]
+
+
 class AnomalyV1(BaseModel):
     """
     Detected anomaly event from State Estimator Agent.
@@ -55,23 +72,23 @@ class AnomalyV1(BaseModel):
     """
 
     model_config = ConfigDict(
-        use_enum_values=True,
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["anomaly_v1"] = Field(
         description="Schema version identifier. Must be 'anomaly_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when anomaly was detected."
     )
 
     # Anomaly identification
-    anomaly_type: AnomalyType = Field(
+    anomaly_type: AnomalyTypeValue = Field(
         description="Type of anomaly detected (sensor fault, stress, offline, etc)."
     )
-    severity: SeverityLevel = Field(
+    severity: SeverityLevelValue = Field(
         description="Severity level: low, medium, high, critical."
     )
     affected_sensor: Optional[str] = Field(
@@ -110,22 +127,13 @@ class AnomalyV1(BaseModel):
         description="Optional notes or recovery suggestions.",
     )
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
     @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'anomaly_v1'."""
-        if v != "anomaly_v1":
-            raise ValueError(
-                f"schema_version must be 'anomaly_v1', got '{v}'"
-            )
-        return v
+    def build_trusted(cls, **data: object) -> "AnomalyV1":
+        """Build an AnomalyV1 from values an internal producer already constrained.
+
+        Skips validation via ``model_construct``. Callers must pass
+        ``schema_version="anomaly_v1"``, an aware ``timestamp``, plain string
+        enum values and in-range numeric fields. Anything crossing an external
+        boundary must use ``AnomalyV1(...)``.
+        """
+        return cls.model_construct(**data)
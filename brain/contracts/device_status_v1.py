@@ -1,9 +1,8 @@
 """DeviceStatusV1: Device ON/OFF states and telemetry from observation sources."""
 
-from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class DeviceStatusV1(BaseModel):
@@ -36,13 +35,14 @@ class DeviceStatusV1(BaseModel):
     model_config = ConfigDict(
         ser_json_timedelta="float",
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["device_status_v1"] = Field(
         description="Schema version identifier. Must be 'device_status_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when this device status was recorded."
     )
 
@@ -89,23 +89,3 @@ class DeviceStatusV1(BaseModel):
         ge=0,
         description="Cumulative water pump pulse count. None if not tracked.",
     )
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'device_status_v1'."""
-        if v != "device_status_v1":
-            raise ValueError(
-                f"schema_version must be 'device_status_v1', got '{v}'"
-            )
-        return v
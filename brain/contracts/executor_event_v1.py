@@ -1,10 +1,12 @@
 """ExecutorEventV1: execution-path observability for Stage 2 mock executor."""
 
-from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
+
+from .guardrail_result_v1 import GuardrailReasonCodeValue
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class ExecutorStatus(str, Enum):
     """Execution outcome for a proposed action."""
@@ -13,21 +15,42 @@ class ExecutorStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+ExecutorStatusValue = Literal["executed", "skipped"]
+
+
+class ExecutorReasonCode(str, Enum):
+    """Reason codes the executor appends to guardrail codes on skip."""
+
+    IDEMPOTENCY_DUPLICATE = "idempotency_duplicate"
+    NON_RETRYABLE_DISPATCH = "non_retryable_dispatch"
+    RETRY_CLASS_NOT_ALLOWED = "retry_class_not_allowed"
+    RETRY_EXHAUSTED = "retry_exhausted"
+
+
+ExecutorEventReasonCodeValue = Literal[
+    GuardrailReasonCodeValue,
+    "idempotency_duplicate",
+    "non_retryable_dispatch",
+    "retry_class_not_allowed",
+    "retry_exhausted",
+]
+
+
 class ExecutorEventV1(BaseModel):
     """Event emitted by executor for each proposed action."""
 
     model_config = ConfigDict(
-        use_enum_values=True,
         strict=True,
+        frozen=True,
     )
 
-    schema_version: str = Field(
+    schema_version: Literal["executor_event_v1"] = Field(
         description="Schema version identifier. Must be 'executor_event_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when executor processed the action.",
     )
-    status: ExecutorStatus = Field(
+    status: ExecutorStatusValue = Field(
         description="Execution status: executed or skipped.",
     )
     action_type: str = Field(
@@ -36,9 +59,12 @@ class ExecutorEventV1(BaseModel):
     guardrail_decision: str = Field(
         description="Guardrail decision value (approved/rejected/clipped).",
     )
-    reason_codes: list[str] = Field(
+    reason_codes: list[ExecutorEventReasonCodeValue] = Field(
         default_factory=list,
-        description="Guardrail reason codes propagated for observability.",
+        description=(
+            "Guardrail reason codes propagated for observability, plus any "
+            "executor-specific skip codes."
+        ),
     )
     duration_seconds: Optional[float] = Field(
         default=None,
@@ -50,22 +76,14 @@ class ExecutorEventV1(BaseModel):
         description="Optional operator-facing executor note.",
     )
 
-    @field_validator("timestamp")
     @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'executor_event_v1'."""
-        if v != "executor_event_v1":
-            raise ValueError(
-                f"schema_version must be 'executor_event_v1', got '{v}'"
-            )
-        return v
+    def build_trusted(cls, **data: object) -> "ExecutorEventV1":
+        """Build an ExecutorEventV1 from values the executor already constrained.
+
+        Skips validation via ``model_construct``. Callers must pass
+        ``schema_version="executor_event_v1"``, an aware ``timestamp``, plain
+        string enum values (``ExecutorStatus.SKIPPED.value``) and reason codes
+        taken from validated contracts. Anything crossing an external boundary
+        must use ``ExecutorEventV1(...)``.
+        """
+        return cls.model_construct(**data)
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
 
 
 class ForecastPointV1(BaseModel):
     """Single forecast point at a fixed cadence."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True)
 
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp for this forecast point.",
     )
     ext_temp_c: float = Field(description="External air temperature in Celsius.")
@@ -38,14 +37,6 @@ class ForecastPointV1(BaseModel):
         description="External solar radiation in W/m^2.",
     )
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, value: datetime) -> datetime:
-        """Ensure forecast timestamps are timezone-aware."""
-        if value.tzinfo is None:
-            raise ValueError("timestamp must include timezone info")
-        return value
-
     @model_validator(mode="after")
     def validate_cloud_or_solar_present(self) -> "ForecastPointV1":
         """At least one sky/solar signal must be present."""
@@ -57,10 +48,10 @@ class ForecastPointV1(BaseModel):
 class Forecast36hV1(BaseModel):
     """Normalized weather forecast for Stage 3 world-model ingestion."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True)
 
     schema_version: Literal["forecast_36h_v1"]
-    generated_at: datetime = Field(
+    generated_at: AwareDatetime = Field(
         description="Timestamp when forecast normalization was produced.",
     )
     source: str = Field(description="Source name for normalized forecast data.")
@@ -80,20 +71,23 @@ class Forecast36hV1(BaseModel):
         description="Ordered forecast points for the horizon.",
     )
 
-    @field_validator("generated_at")
-    @classmethod
-    def validate_generated_at_has_timezone(cls, value: datetime) -> datetime:
-        """Ensure generated_at is timezone-aware."""
-        if value.tzinfo is None:
-            raise ValueError("generated_at must include timezone info")
-        return value
-
     @model_validator(mode="after")
     def validate_points_are_ordered(self) -> "Forecast36hV1":
         """Forecast points must be strictly ordered by timestamp."""
-        if len(self.points) < 2:
-            return self
-        for prev, curr in zip(self.points, self.points[1:]):
-            if curr.timestamp <= prev.timestamp:
-                raise ValueError("points must be strictly ordered by timestamp")
+        points = self.points
+        if any(
+            prev.timestamp >= curr.timestamp for prev, curr in zip(points, points[1:])
+        ):
+            raise ValueError("points must be strictly ordered by timestamp")
         return self
+
+    @classmethod
+    def build_trusted(cls, **data: object) -> "Forecast36hV1":
+        """Build a Forecast36hV1 from already validated, ordered points.
+
+        Skips validation via ``model_construct``, including the ordering check.
+        Only for producers that hold validated ``ForecastPointV1`` instances in
+        strictly increasing timestamp order; raw payloads must go through
+        ``Forecast36hV1(...)``.
+        """
+        return cls.model_construct(**data)
@@ -1,9 +1,9 @@
 """GuardrailResultV1: validation outcome for proposed control actions."""
 
-from datetime import datetime
 from enum import Enum
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
 
 
 class GuardrailDecision(str, Enum):
@@ -14,6 +14,9 @@ class GuardrailDecision(str, Enum):
     CLIPPED = "clipped"
 
 
+GuardrailDecisionValue = Literal["approved", "rejected", "clipped"]
+
+
 class GuardrailReasonCode(str, Enum):
     """Standardized machine-readable reason codes for guardrail outcomes."""
 
@@ -27,24 +30,41 @@ class GuardrailReasonCode(str, Enum):
     ACTION_CLIPPED = "action_clipped"
 
 
+GuardrailReasonCodeValue = Literal[
+    "budget_exceeded",
+    "interval_violation",
+    "stale_data",
+    "low_confidence",
+    "device_offline",
+    "environment_limit",
+    "action_invalid",
+    "action_clipped",
+]
+
+
+_DECISIONS_REQUIRING_REASONS = frozenset(
+    {GuardrailDecision.REJECTED.value, GuardrailDecision.CLIPPED.value}
+)
+
+
 class GuardrailResultV1(BaseModel):
     """Validation result for a proposed action before execution."""
 
     model_config = ConfigDict(
-        use_enum_values=True,
         strict=True,
+        frozen=True,
     )
 
-    schema_version: str = Field(
+    schema_version: Literal["guardrail_result_v1"] = Field(
         description="Schema version identifier. Must be 'guardrail_result_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when guardrail validation completed.",
     )
-    decision: GuardrailDecision = Field(
+    decision: GuardrailDecisionValue = Field(
         description="Outcome of guardrail validation: approved, rejected, or clipped.",
     )
-    reason_codes: list[GuardrailReasonCode] = Field(
+    reason_codes: list[GuardrailReasonCodeValue] = Field(
         default_factory=list,
         description="Machine-readable reason codes explaining rejection or clipping.",
     )
@@ -57,33 +77,10 @@ class GuardrailResultV1(BaseModel):
         description="Optional operator-facing context for logs or debugging.",
     )
 
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'guardrail_result_v1'."""
-        if v != "guardrail_result_v1":
-            raise ValueError(
-                f"schema_version must be 'guardrail_result_v1', got '{v}'"
-            )
-        return v
-
     @model_validator(mode="after")
     def validate_reason_codes_for_decision(self) -> "GuardrailResultV1":
         """Rejected/clipped outcomes must include at least one reason code."""
-        if self.decision in {
-            GuardrailDecision.REJECTED,
-            GuardrailDecision.CLIPPED,
-        } and not self.reason_codes:
+        if self.decision in _DECISIONS_REQUIRING_REASONS and not self.reason_codes:
             raise ValueError(
                 "reason_codes must be provided when decision is rejected or clipped"
             )
@@ -0,0 +1,99 @@
+"""ObservationBatch: column-oriented view over a run of ObservationV1 records."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from ._adapters import OBSERVATION_V1_LIST_ADAPTER
+from .observation_v1 import ObservationV1
+
+_MISSING = math.nan
+
+
+def _float_column() -> array:
+    return array("d")
+
+
+def _or_missing(value: Optional[float]) -> float:
+    return _MISSING if value is None else value
+
+
+def _or_none(value: float) -> Optional[float]:
+    # NaN never passes ObservationV1's range checks, so it only marks "missing".
+    return None if value != value else value
+
+
+@dataclass
+class ObservationBatch:
+    """Struct-of-arrays storage for many ObservationV1 records.
+
+    Every float field is kept in a contiguous ``array('d')`` column so window
+    statistics can scan a single field without touching every model. Missing
+    optional readings are stored as NaN, keeping the columns uniformly typed.
+    Rows are only turned back into models on demand via `to_models`.
+    """
+
+    timestamps: list[datetime] = field(default_factory=list)
+    soil_moisture_p1: array = field(default_factory=_float_column)
+    soil_moisture_p2: array = field(default_factory=_float_column)
+    air_temperature: array = field(default_factory=_float_column)
+    air_humidity: array = field(default_factory=_float_column)
+    co2_ppm: array = field(default_factory=_float_column)
+    light_intensity: array = field(default_factory=_float_column)
+    sensor_faults: list[Optional[dict[str, bool]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, observation: ObservationV1) -> None:
+        """Append one validated observation as a new row."""
+        self.timestamps.append(observation.timestamp)
+        self.soil_moisture_p1.append(observation.soil_moisture_p1)
+        self.soil_moisture_p2.append(_or_missing(observation.soil_moisture_p2))
+        self.air_temperature.append(observation.air_temperature)
+        self.air_humidity.append(observation.air_humidity)
+        self.co2_ppm.append(_or_missing(observation.co2_ppm))
+        self.light_intensity.append(_or_missing(observation.light_intensity))
+        self.sensor_faults.append(observation.sensor_faults)
+
+    @classmethod
+    def from_models(cls, observations: Iterable[ObservationV1]) -> "ObservationBatch":
+        """Build a batch from already validated observations."""
+        batch = cls()
+        for observation in observations:
+            batch.append(observation)
+        return batch
+
+    @classmethod
+    def from_jsonl(cls, path: str | Path) -> "ObservationBatch":
+        """Load a JSONL file holding one ObservationV1 object per line.
+
+        Blank lines are skipped. The remaining lines are joined into one JSON
+        array and validated in a single `OBSERVATION_V1_LIST_ADAPTER` call.
+        """
+        with Path(path).open("rb") as handle:
+            lines = [line for line in (raw.strip() for raw in handle) if line]
+        payload = b"[" + b",".join(lines) + b"]"
+        return cls.from_models(OBSERVATION_V1_LIST_ADAPTER.validate_json(payload))
+
+    def to_models(self) -> list[ObservationV1]:
+        """Rebuild ObservationV1 rows; values were validated on the way in."""
+        return [
+            ObservationV1.model_construct(
+                schema_version="observation_v1",
+                timestamp=self.timestamps[i],
+                soil_moisture_p1=self.soil_moisture_p1[i],
+                soil_moisture_p2=_or_none(self.soil_moisture_p2[i]),
+                air_temperature=self.air_temperature[i],
+                air_humidity=self.air_humidity[i],
+                co2_ppm=_or_none(self.co2_ppm[i]),
+                light_intensity=_or_none(self.light_intensity[i]),
+                sensor_faults=self.sensor_faults[i],
+            )
+            for i in range(len(self))
+        ]
@@ -1,9 +1,8 @@
 """ObservationV1: Raw sensor readings from observation sources (synthetic or replay)."""
 
-from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class ObservationV1(BaseModel):
@@ -37,13 +36,14 @@ class ObservationV1(BaseModel):
     model_config = ConfigDict(
         ser_json_timedelta="float",
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["observation_v1"] = Field(
         description="Schema version identifier. Must be 'observation_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when this observation was recorded."
     )
 
@@ -89,23 +89,3 @@ class ObservationV1(BaseModel):
         "(e.g., {'soil_p1': False, 'air_temp': True}). "
         "None if not tracked at source level.",
     )
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'observation_v1'."""
-        if v != "observation_v1":
-            raise ValueError(
-                f"schema_version must be 'observation_v1', got '{v}'"
-            )
-        return v
@@ -1,10 +1,9 @@
 """SensorHealthV1: Per-sensor diagnostics and fault detection."""
 
-from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class FaultType(str, Enum):
@@ -45,15 +44,15 @@ class SensorHealthV1(BaseModel):
     """
 
     model_config = ConfigDict(
-        use_enum_values=True,
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["sensor_health_v1"] = Field(
         description="Schema version identifier. Must be 'sensor_health_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when diagnostics were computed."
     )
 
@@ -114,23 +113,3 @@ class SensorHealthV1(BaseModel):
         default=None,
         description="Optional diagnostic notes or recommendations.",
     )
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
-
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'sensor_health_v1'."""
-        if v != "sensor_health_v1":
-            raise ValueError(
-                f"schema_version must be 'sensor_health_v1', got '{v}'"
-            )
-        return v
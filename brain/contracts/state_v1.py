@@ -1,9 +1,8 @@
 """StateV1: Estimated plant state with sensor readings and confidence scores."""
 
-from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class StateV1(BaseModel):
@@ -34,13 +33,14 @@ class StateV1(BaseModel):
     model_config = ConfigDict(
         ser_json_timedelta="float",
         strict=True,
+        frozen=True,
     )
 
     # Contract metadata
-    schema_version: str = Field(
+    schema_version: Literal["state_v1"] = Field(
         description="Schema version identifier. Must be 'state_v1'.",
     )
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp (UTC) when this state was estimated."
     )
 
@@ -100,22 +100,13 @@ class StateV1(BaseModel):
         description="Optional human-readable notes or warnings.",
     )
 
-    @field_validator("timestamp")
     @classmethod
-    def validate_timestamp_has_timezone(cls, v: datetime) -> datetime:
-        """Ensure timestamp has timezone info (must be aware)."""
-        if v.tzinfo is None:
-            raise ValueError(
-                "timestamp must include timezone info. Use datetime.now(timezone.utc)"
-            )
-        return v
+    def build_trusted(cls, **data: object) -> "StateV1":
+        """Build a StateV1 from values an internal producer already constrained.
 
-    @field_validator("schema_version")
-    @classmethod
-    def validate_schema_version(cls, v: str) -> str:
-        """Ensure schema_version is exactly 'state_v1'."""
-        if v != "state_v1":
-            raise ValueError(
-                f"schema_version must be 'state_v1', got '{v}'"
-            )
-        return v
+        Skips validation via ``model_construct``. Callers must pass
+        ``schema_version="state_v1"``, an aware ``timestamp`` and in-range
+        numeric fields, e.g. readings copied from a validated ObservationV1.
+        Anything crossing an external boundary must use ``StateV1(...)``.
+        """
+        return cls.model_construct(**data)
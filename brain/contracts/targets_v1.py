@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, model_validator
 
 
 class TargetEnvelopeV1(BaseModel):
     """Environmental and soil target bounds."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     vpd_min_kpa: float = Field(ge=0.0)
     vpd_max_kpa: float = Field(ge=0.0)
@@ -30,7 +29,7 @@ class TargetEnvelopeV1(BaseModel):
 class BudgetAdaptationV1(BaseModel):
     """Budget multipliers after weather adaptation."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     water_budget_multiplier: float = Field(ge=0.5, le=2.0)
     co2_budget_multiplier: float = Field(ge=0.5, le=2.0)
@@ -39,23 +38,16 @@ class BudgetAdaptationV1(BaseModel):
 class TargetsV1(BaseModel):
     """World-model output: base and adapted targets with active scenarios."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     schema_version: Literal["targets_v1"]
-    generated_at: datetime
-    valid_until_ts: datetime
+    generated_at: AwareDatetime
+    valid_until_ts: AwareDatetime
     base_targets: TargetEnvelopeV1
     adapted_targets: TargetEnvelopeV1
     adapted_budgets: BudgetAdaptationV1
     active_scenarios: list[str] = Field(default_factory=list)
 
-    @field_validator("generated_at", "valid_until_ts")
-    @classmethod
-    def validate_timezone(cls, value: datetime) -> datetime:
-        if value.tzinfo is None:
-            raise ValueError("timestamps must include timezone info")
-        return value
-
     @model_validator(mode="after")
     def validate_window(self) -> "TargetsV1":
         if self.valid_until_ts <= self.generated_at:
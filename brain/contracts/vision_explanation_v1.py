@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class VisionExplanationV1(BaseModel):
     """Explanation payload paired with one VisionV1 result."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     schema_version: Literal["vision_explanation_v1"]
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp of explanation generation.",
     )
     image_ref: str = Field(
@@ -38,9 +37,13 @@ class VisionExplanationV1(BaseModel):
         description="Known limitations for this inference cycle.",
     )
 
-    @field_validator("timestamp")
     @classmethod
-    def validate_timestamp_has_timezone(cls, value: datetime) -> datetime:
-        if value.tzinfo is None:
-            raise ValueError("timestamp must include timezone info")
-        return value
+    def build_trusted(cls, **data: object) -> "VisionExplanationV1":
+        """Build a VisionExplanationV1 from values an internal producer already constrained.
+
+        Skips validation via ``model_construct``. Callers must pass
+        ``schema_version="vision_explanation_v1"``, an aware ``timestamp`` and
+        non-empty reference/summary strings. Anything crossing an external
+        boundary must use ``VisionExplanationV1(...)``.
+        """
+        return cls.model_construct(**data)
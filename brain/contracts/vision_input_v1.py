@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class VisionInputV1(BaseModel):
     """Vision analyzer input metadata for one evaluation cycle."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     schema_version: Literal["vision_input_v1"]
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp for this vision input message.",
     )
     image_ref: str = Field(
@@ -33,10 +32,3 @@ class VisionInputV1(BaseModel):
         default=None,
         description="Optional camera identifier.",
     )
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, value: datetime) -> datetime:
-        if value.tzinfo is None:
-            raise ValueError("timestamp must include timezone info")
-        return value
@@ -2,19 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field
 
 
 class VisionV1(BaseModel):
     """Structured vision assessment for one image/cycle."""
 
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, frozen=True, defer_build=True)
 
     schema_version: Literal["vision_v1"]
-    timestamp: datetime = Field(
+    timestamp: AwareDatetime = Field(
         description="ISO8601 timestamp for vision assessment.",
     )
     image_ref: str = Field(
@@ -39,10 +38,3 @@ class VisionV1(BaseModel):
         default_factory=list,
         description="Subset of findings interpreted as stress signals.",
     )
-
-    @field_validator("timestamp")
-    @classmethod
-    def validate_timestamp_has_timezone(cls, value: datetime) -> datetime:
-        if value.tzinfo is None:
-            raise ValueError("timestamp must include timezone info")
-        return value
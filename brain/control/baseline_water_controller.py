@@ -8,16 +8,10 @@ from datetime import datetime
 from brain.contracts import ActionV1, StateV1
 from brain.contracts.action_v1 import ActionType
 
+_UNFORMATTED_REASON = "Stage 2 water-only policy: soil_moisture_p1 below trigger."
 
-def _clamp(value: float, low: float, high: float) -> float:
-    if value < low:
-        return low
-    if value > high:
-        return high
-    return value
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaselineWaterControlConfig:
     """Configuration for water-only baseline policy."""
 
@@ -33,10 +27,27 @@ class BaselineWaterController:
 
     Stage 2 intentionally emits only `ActionType.WATER`. All other action
     types are deferred to next stages.
+
+    Set ``include_reason=False`` when callers never read `ActionV1.reason` to
+    skip formatting the moisture values into it on every proposal.
     """
 
-    def __init__(self, config: BaselineWaterControlConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: BaselineWaterControlConfig | None = None,
+        *,
+        include_reason: bool = True,
+    ) -> None:
         self._config = config or BaselineWaterControlConfig()
+        self._include_reason = include_reason
+        # Derived policy constants; the config is frozen, so compute them once.
+        self._trigger = self._config.trigger_threshold
+        self._target = self._config.target_moisture
+        self._target_denominator = max(self._config.target_moisture, 1e-9)
+        self._min_duration = self._config.min_duration_seconds
+        self._duration_span = (
+            self._config.max_duration_seconds - self._config.min_duration_seconds
+        )
 
     def propose_action(
         self,
@@ -45,28 +56,26 @@ class BaselineWaterController:
         now: datetime | None = None,
     ) -> ActionV1 | None:
         """Return a water action when p1 moisture is below trigger threshold."""
-        if state.soil_moisture_p1 >= self._config.trigger_threshold:
+        if state.soil_moisture_p1 >= self._trigger:
             return None
 
         timestamp = now or state.timestamp
-        moisture_deficit = max(0.0, self._config.target_moisture - state.soil_moisture_p1)
-        normalized_deficit = _clamp(
-            moisture_deficit / max(self._config.target_moisture, 1e-9), 0.0, 1.0
-        )
-        duration_seconds = self._config.min_duration_seconds + normalized_deficit * (
-            self._config.max_duration_seconds - self._config.min_duration_seconds
-        )
+        moisture_deficit = max(0.0, self._target - state.soil_moisture_p1)
+        normalized_deficit = max(0.0, min(1.0, moisture_deficit / self._target_denominator))
+        duration_seconds = self._min_duration + normalized_deficit * self._duration_span
 
-        return ActionV1(
+        return ActionV1.build_trusted(
             schema_version="action_v1",
             timestamp=timestamp,
-            action_type=ActionType.WATER,
+            action_type=ActionType.WATER.value,
             duration_seconds=round(duration_seconds, 3),
             intensity=self._config.intensity,
             reason=(
                 "Stage 2 water-only policy: soil_moisture_p1 "
                 f"({state.soil_moisture_p1:.3f}) below trigger "
-                f"({self._config.trigger_threshold:.3f})."
+                f"({self._trigger:.3f})."
+                if self._include_reason
+                else _UNFORMATTED_REASON
             ),
             estimated_impact=round(normalized_deficit, 3),
             confidence=state.confidence,
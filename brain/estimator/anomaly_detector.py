@@ -3,35 +3,74 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Iterable
+from itertools import chain, islice
+from typing import Iterable, NamedTuple, Sequence
 
 from brain.contracts import AnomalyV1, DeviceStatusV1, ObservationV1, SensorHealthV1
 from brain.contracts.anomaly_v1 import AnomalyType, SeverityLevel
 from brain.contracts.sensor_health_v1 import FaultType
 
+_SOIL_LOW = 0.10
+_SOIL_HIGH = 0.85
+_SOIL_DIFFERENTIAL = 0.40
+_VPD_HIGH = 3.5
+_VPD_LOW = 0.2
+_TEMP_LOW = 8.0
+_TEMP_HIGH = 32.0
+_TEMP_RATE_10M = 3.0
+_MOISTURE_DROP_30M = 0.05
+
+_NO_DELAY = timedelta(0)
+_WINDOW_10M = timedelta(minutes=10)
+_WINDOW_20M = timedelta(minutes=20)
+_WINDOW_30M = timedelta(minutes=30)
+
+# Name-keyed view kept for callers that inspect the configured thresholds; the
+# detector itself compares against the module constants above.
 THRESHOLDS = {
-    "soil_moisture_low": 0.10,
-    "soil_moisture_high": 0.85,
-    "soil_moisture_differential": 0.40,
-    "vpd_high": 3.5,
-    "vpd_low": 0.2,
-    "temperature_low": 8.0,
-    "temperature_high": 32.0,
-    "temperature_rate_10m": 3.0,
-    "moisture_drop_30m": 0.05,
+    "soil_moisture_low": _SOIL_LOW,
+    "soil_moisture_high": _SOIL_HIGH,
+    "soil_moisture_differential": _SOIL_DIFFERENTIAL,
+    "vpd_high": _VPD_HIGH,
+    "vpd_low": _VPD_LOW,
+    "temperature_low": _TEMP_LOW,
+    "temperature_high": _TEMP_HIGH,
+    "temperature_rate_10m": _TEMP_RATE_10M,
+    "moisture_drop_30m": _MOISTURE_DROP_30M,
 }
 
 
-def _severity_for_fault(fault: FaultType) -> SeverityLevel:
-    if fault == FaultType.JUMP:
-        return SeverityLevel.HIGH
-    if fault == FaultType.DISCONNECTED:
-        return SeverityLevel.HIGH
-    if fault == FaultType.STUCK:
-        return SeverityLevel.MEDIUM
-    if fault == FaultType.DRIFT:
-        return SeverityLevel.MEDIUM
-    return SeverityLevel.LOW
+_FAULT_TO_ANOMALY = {
+    FaultType.STUCK: AnomalyType.SENSOR_STUCK,
+    FaultType.JUMP: AnomalyType.SENSOR_JUMP,
+    FaultType.DRIFT: AnomalyType.SENSOR_DRIFT,
+    FaultType.DISCONNECTED: AnomalyType.SENSOR_DISCONNECT,
+}
+_FAULT_TO_SEVERITY = {
+    FaultType.JUMP: SeverityLevel.HIGH,
+    FaultType.DISCONNECTED: SeverityLevel.HIGH,
+    FaultType.STUCK: SeverityLevel.MEDIUM,
+    FaultType.DRIFT: SeverityLevel.MEDIUM,
+}
+_FAULT_DESCRIPTIONS = {fault: f"Sensor fault detected: {fault.value}" for fault in FaultType}
+# Fields every detector-emitted anomaly shares; per-call values are merged in.
+_ANOMALY_TEMPLATE = {
+    "schema_version": "anomaly_v1",
+    "confidence": 0.9,
+    "expected_duration_seconds": None,
+}
+_DETECTION_MODE_NOTES = {
+    mode: f"detection_mode={mode}" for mode in ("instant", "sustained", "rate")
+}
+# severity -> (stored value, action_recommended, requires_safe_mode)
+_SEVERITY_DECISIONS = {
+    severity: (
+        severity.value,
+        severity in (SeverityLevel.HIGH, SeverityLevel.CRITICAL),
+        severity is SeverityLevel.CRITICAL,
+    )
+    for severity in SeverityLevel
+}
 
 
 def _make_anomaly(
@@ -42,29 +81,49 @@ def _make_anomaly(
     affected_sensor: str | None = None,
     detection_mode: str = "instant",
 ) -> AnomalyV1:
-    return AnomalyV1(
-        schema_version="anomaly_v1",
+    notes = _DETECTION_MODE_NOTES.get(detection_mode) or f"detection_mode={detection_mode}"
+    severity_value, action_recommended, requires_safe_mode = _SEVERITY_DECISIONS[severity]
+    return AnomalyV1.build_trusted(
+        **_ANOMALY_TEMPLATE,
         timestamp=timestamp,
-        anomaly_type=anomaly_type,
-        severity=severity,
+        anomaly_type=anomaly_type.value,
+        severity=severity_value,
         affected_sensor=affected_sensor,
         description=description,
-        confidence=0.9,
-        action_recommended=severity in (SeverityLevel.HIGH, SeverityLevel.CRITICAL),
-        expected_duration_seconds=None,
-        requires_safe_mode=severity == SeverityLevel.CRITICAL,
-        notes=f"detection_mode={detection_mode}",
+        action_recommended=action_recommended,
+        requires_safe_mode=requires_safe_mode,
+        notes=notes,
     )
 
 
-def _recent_breach_count(
-    history: list[ObservationV1],
-    now: datetime,
-    minutes: int,
-    predicate,
-) -> int:
-    cutoff = now - timedelta(minutes=minutes)
-    return sum(1 for obs in history if obs.timestamp >= cutoff and predicate(obs))
+class _BreachCounts(NamedTuple):
+    soil_low_30m: int
+    soil_high_30m: int
+    temp_high_20m: int
+
+
+def _scan_history(newest_first: Iterable[ObservationV1], now: datetime) -> _BreachCounts:
+    """Count sustained-threshold breaches for every window in one pass.
+
+    Observations must be supplied newest first. History is chronological (as
+    `TimeRingBuffer` keeps it), so the scan can stop at the first item older
+    than the widest window.
+    """
+    cutoff_30m = now - _WINDOW_30M
+    cutoff_20m = now - _WINDOW_20M
+    soil_low = soil_high = temp_high = 0
+    for obs in newest_first:
+        ts = obs.timestamp
+        if ts < cutoff_30m:
+            break
+        sm = obs.soil_moisture_p1
+        if sm < _SOIL_LOW:
+            soil_low += 1
+        elif sm > _SOIL_HIGH:
+            soil_high += 1
+        if ts >= cutoff_20m and obs.air_temperature > _TEMP_HIGH:
+            temp_high += 1
+    return _BreachCounts(soil_low, soil_high, temp_high)
 
 
 def detect_anomalies(
@@ -72,25 +131,31 @@ def detect_anomalies(
     vpd_kpa: float,
     sensor_health: Iterable[SensorHealthV1],
     device_status: DeviceStatusV1,
-    history: Iterable[ObservationV1] | None = None,
+    history: Sequence[ObservationV1] | None = None,
 ) -> list[AnomalyV1]:
-    """Detect anomalies using deterministic threshold + temporal checks."""
+    """Detect anomalies using deterministic threshold + temporal checks.
+
+    `history` is read in place and may or may not already end with `observation`.
+    """
     anomalies: list[AnomalyV1] = []
     now = observation.timestamp
-    history_list = list(history or [])
-    if not history_list or history_list[-1] is not observation:
-        history_list.append(observation)
-    previous = history_list[-2] if len(history_list) >= 2 else None
+    if history is None:
+        history = ()
+    elif not isinstance(history, Sequence):
+        history = tuple(history)
+    if history and history[-1] is observation:
+        older = islice(reversed(history), 1, None)
+        previous = history[-2] if len(history) >= 2 else None
+    else:
+        older = reversed(history)
+        previous = history[-1] if history else None
+    breaches = _scan_history(chain((observation,), older), now)
 
-    # Soil moisture thresholds (instant + sustained)
-    if observation.soil_moisture_p1 < THRESHOLDS["soil_moisture_low"]:
+    # Soil moisture thresholds (instant + sustained). Each low/high pair is
+    # exclusive (low < high), so its second check uses elif.
+    if observation.soil_moisture_p1 < _SOIL_LOW:
         mode = "instant"
-        if _recent_breach_count(
-            history_list,
-            now,
-            minutes=30,
-            predicate=lambda obs: obs.soil_moisture_p1 < THRESHOLDS["soil_moisture_low"],
-        ) >= 2:
+        if breaches.soil_low_30m >= 2:
             mode = "sustained"
         anomalies.append(
             _make_anomaly(
@@ -102,14 +167,9 @@ def detect_anomalies(
                 detection_mode=mode,
             )
         )
-    if observation.soil_moisture_p1 > THRESHOLDS["soil_moisture_high"]:
+    elif observation.soil_moisture_p1 > _SOIL_HIGH:
         mode = "instant"
-        if _recent_breach_count(
-            history_list,
-            now,
-            minutes=30,
-            predicate=lambda obs: obs.soil_moisture_p1 > THRESHOLDS["soil_moisture_high"],
-        ) >= 2:
+        if breaches.soil_high_30m >= 2:
             mode = "sustained"
         anomalies.append(
             _make_anomaly(
@@ -123,7 +183,7 @@ def detect_anomalies(
         )
     if observation.soil_moisture_p2 is not None:
         diff = abs(observation.soil_moisture_p1 - observation.soil_moisture_p2)
-        if diff > THRESHOLDS["soil_moisture_differential"]:
+        if diff > _SOIL_DIFFERENTIAL:
             anomalies.append(
                 _make_anomaly(
                     now,
@@ -136,7 +196,7 @@ def detect_anomalies(
             )
 
     # VPD thresholds
-    if vpd_kpa > THRESHOLDS["vpd_high"]:
+    if vpd_kpa > _VPD_HIGH:
         anomalies.append(
             _make_anomaly(
                 now,
@@ -147,7 +207,7 @@ def detect_anomalies(
                 detection_mode="instant",
             )
         )
-    if vpd_kpa < THRESHOLDS["vpd_low"]:
+    elif vpd_kpa < _VPD_LOW:
         anomalies.append(
             _make_anomaly(
                 now,
@@ -160,7 +220,7 @@ def detect_anomalies(
         )
 
     # Temperature thresholds (instant + sustained)
-    if observation.air_temperature < THRESHOLDS["temperature_low"]:
+    if observation.air_temperature < _TEMP_LOW:
         anomalies.append(
             _make_anomaly(
                 now,
@@ -171,14 +231,9 @@ def detect_anomalies(
                 detection_mode="instant",
             )
         )
-    if observation.air_temperature > THRESHOLDS["temperature_high"]:
+    elif observation.air_temperature > _TEMP_HIGH:
         mode = "instant"
-        if _recent_breach_count(
-            history_list,
-            now,
-            minutes=20,
-            predicate=lambda obs: obs.air_temperature > THRESHOLDS["temperature_high"],
-        ) >= 2:
+        if breaches.temp_high_20m >= 2:
             mode = "sustained"
         anomalies.append(
             _make_anomaly(
@@ -193,10 +248,10 @@ def detect_anomalies(
 
     # Rate-based checks
     if previous is not None:
-        delta_minutes = (now - previous.timestamp).total_seconds() / 60.0
-        if 0 < delta_minutes <= 10:
+        delta = now - previous.timestamp
+        if _NO_DELAY < delta <= _WINDOW_10M:
             temp_delta = abs(observation.air_temperature - previous.air_temperature)
-            if temp_delta > THRESHOLDS["temperature_rate_10m"]:
+            if temp_delta > _TEMP_RATE_10M:
                 anomalies.append(
                     _make_anomaly(
                         now,
@@ -207,9 +262,9 @@ def detect_anomalies(
                         detection_mode="rate",
                     )
                 )
-        if 0 < delta_minutes <= 30:
+        if _NO_DELAY < delta <= _WINDOW_30M:
             moisture_drop = previous.soil_moisture_p1 - observation.soil_moisture_p1
-            if moisture_drop > THRESHOLDS["moisture_drop_30m"]:
+            if moisture_drop > _MOISTURE_DROP_30M:
                 anomalies.append(
                     _make_anomaly(
                         now,
@@ -225,27 +280,14 @@ def detect_anomalies(
     for health in sensor_health:
         if health.fault_state == FaultType.NONE:
             continue
-        if health.fault_state == FaultType.STUCK:
-            anomaly_type = AnomalyType.SENSOR_STUCK
-        elif health.fault_state == FaultType.JUMP:
-            anomaly_type = AnomalyType.SENSOR_JUMP
-        elif health.fault_state == FaultType.DRIFT:
-            anomaly_type = AnomalyType.SENSOR_DRIFT
-        elif health.fault_state == FaultType.DISCONNECTED:
-            anomaly_type = AnomalyType.SENSOR_DISCONNECT
-        else:
-            anomaly_type = AnomalyType.UNKNOWN
-        fault_label = (
-            health.fault_state.value
-            if hasattr(health.fault_state, "value")
-            else str(health.fault_state)
-        )
+        anomaly_type = _FAULT_TO_ANOMALY.get(health.fault_state, AnomalyType.UNKNOWN)
         anomalies.append(
             _make_anomaly(
                 now,
                 anomaly_type,
-                _severity_for_fault(health.fault_state),
-                f"Sensor fault detected: {fault_label}",
+                _FAULT_TO_SEVERITY.get(health.fault_state, SeverityLevel.LOW),
+                _FAULT_DESCRIPTIONS.get(health.fault_state)
+                or f"Sensor fault detected: {health.fault_state}",
                 affected_sensor=health.sensor_name,
                 detection_mode="instant",
             )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
-from statistics import pstdev
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence
 
 from brain.contracts import AnomalyV1, ObservationV1, SensorHealthV1
 from brain.contracts.anomaly_v1 import SeverityLevel
@@ -23,72 +23,97 @@ def _age_deduction(age_minutes: float) -> float:
     return 0.50
 
 
-def _variance_deduction(values: list[float], threshold: float, penalty: float) -> float:
-    if len(values) < 2:
+def _history_stdevs(
+    history: Sequence[ObservationV1],
+) -> Optional[tuple[float, float, float]]:
+    """Population std-devs of soil p1, air temperature and humidity.
+
+    Computed together in one Welford pass; None when fewer than two samples.
+    """
+    n = 0
+    soil_mean = temp_mean = humidity_mean = 0.0
+    soil_m2 = temp_m2 = humidity_m2 = 0.0
+    for obs in history:
+        n += 1
+        soil = obs.soil_moisture_p1
+        delta = soil - soil_mean
+        soil_mean += delta / n
+        soil_m2 += delta * (soil - soil_mean)
+        temp = obs.air_temperature
+        delta = temp - temp_mean
+        temp_mean += delta / n
+        temp_m2 += delta * (temp - temp_mean)
+        humidity = obs.air_humidity
+        delta = humidity - humidity_mean
+        humidity_mean += delta / n
+        humidity_m2 += delta * (humidity - humidity_mean)
+    if n < 2:
+        return None
+    return math.sqrt(soil_m2 / n), math.sqrt(temp_m2 / n), math.sqrt(humidity_m2 / n)
+
+
+def _variance_deduction(stdev: Optional[float], threshold: float, penalty: float) -> float:
+    if stdev is None:
         return 0.0
-    if pstdev(values) > threshold:
+    if stdev > threshold:
         return penalty
     return 0.0
 
 
-def _sensor_fault_deduction(fault_state: FaultType) -> float:
-    if fault_state == FaultType.STUCK:
-        return 0.50
-    if fault_state == FaultType.JUMP:
-        return 0.30
-    if fault_state == FaultType.DRIFT:
-        return 0.25
-    if fault_state == FaultType.DISCONNECTED:
-        return 0.70
-    if fault_state == FaultType.OUT_OF_RANGE:
-        return 0.20
-    return 0.0
-
-
-def _anomaly_deduction(severity: SeverityLevel) -> float:
-    if severity == SeverityLevel.LOW:
-        return 0.10
-    if severity == SeverityLevel.MEDIUM:
-        return 0.25
-    if severity in (SeverityLevel.HIGH, SeverityLevel.CRITICAL):
-        return 0.50
-    return 0.0
+_FAULT_DEDUCTIONS = {
+    FaultType.STUCK: 0.50,
+    FaultType.JUMP: 0.30,
+    FaultType.DRIFT: 0.25,
+    FaultType.DISCONNECTED: 0.70,
+    FaultType.OUT_OF_RANGE: 0.20,
+}
+# Keyed by the str-enum members, so AnomalyV1's plain string severities hit too.
+_SEVERITY_DEDUCTIONS = {
+    SeverityLevel.LOW: 0.10,
+    SeverityLevel.MEDIUM: 0.25,
+    SeverityLevel.HIGH: 0.50,
+    SeverityLevel.CRITICAL: 0.50,
+}
 
 
 def compute_confidence(
     observation: ObservationV1,
     vpd_kpa: float,
-    history: Iterable[ObservationV1],
+    history: Sequence[ObservationV1],
     sensor_health: Iterable[SensorHealthV1],
     anomalies: Iterable[AnomalyV1],
     now: Optional[datetime] = None,
 ) -> float:
-    """Compute confidence score from current observation and diagnostics."""
+    """Compute confidence score from current observation and diagnostics.
+
+    Deductions only ever add up, so scoring returns 0.0 as soon as their running
+    total reaches 1.0 and skips the remaining (history, fault, anomaly) checks.
+    """
     if now is None:
         now = observation.timestamp
 
     age_minutes = (now - observation.timestamp).total_seconds() / 60.0
-    deductions = [_age_deduction(age_minutes)]
+    total = _age_deduction(age_minutes)
 
     # Extreme value deductions
     if observation.soil_moisture_p1 < 0.10 or observation.soil_moisture_p1 > 0.90:
-        deductions.append(0.20)
+        total += 0.20
     if observation.air_temperature < 8.0 or observation.air_temperature > 32.0:
-        deductions.append(0.20)
+        total += 0.20
     if observation.air_humidity < 10.0 or observation.air_humidity > 95.0:
-        deductions.append(0.15)
+        total += 0.15
     if vpd_kpa < 0.2 or vpd_kpa > 3.5:
-        deductions.append(0.15)
+        total += 0.15
+    if total >= 1.0:
+        return 0.0
 
     # Variance deductions from recent history
-    recent = list(history)
-    soil_values = [obs.soil_moisture_p1 for obs in recent]
-    temp_values = [obs.air_temperature for obs in recent]
-    humidity_values = [obs.air_humidity for obs in recent]
+    stdevs = _history_stdevs(history)
+    soil_std, temp_std, humidity_std = stdevs if stdevs is not None else (None, None, None)
 
-    deductions.append(_variance_deduction(soil_values, 0.15, 0.15))
-    deductions.append(_variance_deduction(temp_values, 2.0, 0.15))
-    deductions.append(_variance_deduction(humidity_values, 10.0, 0.10))
+    total += _variance_deduction(soil_std, 0.15, 0.15)
+    total += _variance_deduction(temp_std, 2.0, 0.15)
+    total += _variance_deduction(humidity_std, 10.0, 0.10)
 
     # Cross-sensor disagreement
     if observation.soil_moisture_p2 is not None:
@@ -96,15 +121,20 @@ def compute_confidence(
             observation.soil_moisture_p1, observation.soil_moisture_p2, 1e-6
         )
         if abs(observation.soil_moisture_p1 - observation.soil_moisture_p2) / denom > 0.40:
-            deductions.append(0.30)
+            total += 0.30
+    if total >= 1.0:
+        return 0.0
 
     # Sensor fault deductions
     for health in sensor_health:
-        deductions.append(_sensor_fault_deduction(health.fault_state))
+        total += _FAULT_DEDUCTIONS.get(health.fault_state, 0.0)
+        if total >= 1.0:
+            return 0.0
 
     # Anomaly deductions
     for anomaly in anomalies:
-        deductions.append(_anomaly_deduction(anomaly.severity))
+        total += _SEVERITY_DEDUCTIONS.get(anomaly.severity, 0.0)
+        if total >= 1.0:
+            return 0.0
 
-    confidence = max(0.0, 1.0 - sum(deductions))
-    return min(1.0, confidence)
+    return min(1.0, 1.0 - total)
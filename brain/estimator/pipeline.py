@@ -19,7 +19,7 @@ class EstimatorPipeline:
         self._history = TimeRingBuffer(history_hours, lambda obs: obs.timestamp)
 
     def history(self) -> list[ObservationV1]:
-        return self._history.items()
+        return self._history.snapshot()
 
     def process(
         self,
@@ -52,7 +52,7 @@ class EstimatorPipeline:
             now=observation.timestamp,
         )
 
-        state = StateV1(
+        state = StateV1.build_trusted(
             schema_version="state_v1",
             timestamp=observation.timestamp,
             soil_moisture_p1=observation.soil_moisture_p1,
@@ -68,3 +68,15 @@ class EstimatorPipeline:
         )
 
         return state, anomalies, sensor_health
+
+    def process_batch(
+        self,
+        items: Iterable[tuple[ObservationV1, DeviceStatusV1]],
+    ) -> list[tuple[StateV1, list[AnomalyV1], list[SensorHealthV1]]]:
+        """Process chronological (observation, device status) pairs, e.g. for replay.
+
+        Equivalent to calling `process` for each pair in order; results keep the
+        input order.
+        """
+        process = self.process
+        return [process(observation, device_status) for observation, device_status in items]
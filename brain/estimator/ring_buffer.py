@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_left
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from statistics import mean, pstdev
-from typing import Callable, Deque, Generic, Iterable, Optional, TypeVar
+from itertools import islice
+from typing import Callable, Deque, Generic, Iterable, Optional, Sequence, TypeVar
 
 T = TypeVar("T")
 
@@ -23,7 +25,12 @@ class BufferStats:
 
 
 class TimeRingBuffer(Generic[T]):
-    """Ring buffer that retains items within a time window."""
+    """Ring buffer that retains items within a time window.
+
+    Items must be appended in non-decreasing timestamp order: pruning drops from
+    the oldest end, and readers such as the anomaly detector scan newest-first
+    and stop at the first item outside their window.
+    """
 
     def __init__(
         self, max_hours: float, timestamp_getter: Callable[[T], datetime]
@@ -31,6 +38,8 @@ class TimeRingBuffer(Generic[T]):
         if max_hours <= 0:
             raise ValueError("max_hours must be positive")
         self._max_hours = max_hours
+        # Built once: append prunes on every tick.
+        self._max_age = timedelta(hours=max_hours)
         self._timestamp_getter = timestamp_getter
         self._items: Deque[T] = deque()
 
@@ -45,18 +54,30 @@ class TimeRingBuffer(Generic[T]):
         self._prune(timestamp)
 
     def _prune(self, now: datetime) -> None:
-        cutoff = now - timedelta(hours=self._max_hours)
+        cutoff = now - self._max_age
         while self._items:
             oldest = self._items[0]
             if self._timestamp_getter(oldest) >= cutoff:
                 break
             self._items.popleft()
 
-    def items(self) -> list[T]:
+    def items(self) -> Sequence[T]:
+        """Live, oldest-first view of the buffer; callers must not mutate it.
+
+        The view reflects later appends and pruning. Use `snapshot` to keep a
+        detached copy.
+        """
+        return self._items
+
+    def snapshot(self) -> list[T]:
         return list(self._items)
 
+    def index_since(self, cutoff: datetime) -> int:
+        """Position of the first item at or after `cutoff` (binary search)."""
+        return bisect_left(self._items, cutoff, key=self._timestamp_getter)
+
     def get_since(self, cutoff: datetime) -> list[T]:
-        return [item for item in self._items if self._timestamp_getter(item) >= cutoff]
+        return list(islice(self._items, self.index_since(cutoff), None))
 
     def get_last_n_hours(self, hours: float, now: Optional[datetime] = None) -> list[T]:
         if hours <= 0:
@@ -69,21 +90,27 @@ class TimeRingBuffer(Generic[T]):
         return self.get_since(cutoff)
 
     def get_stats(self, value_getter: Callable[[T], float]) -> BufferStats:
-        values = [value_getter(item) for item in self._items]
-        if not values:
+        """Summarise one numeric field in a single pass (Welford for mean/std)."""
+        count = 0
+        minimum = maximum = mean = m2 = 0.0
+        for item in self._items:
+            value = value_getter(item)
+            count += 1
+            if count == 1:
+                minimum = maximum = value
+            elif value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        if count == 0:
             return BufferStats(count=0, minimum=None, maximum=None, mean=None, std=None)
-        if len(values) == 1:
-            return BufferStats(
-                count=1,
-                minimum=values[0],
-                maximum=values[0],
-                mean=values[0],
-                std=0.0,
-            )
         return BufferStats(
-            count=len(values),
-            minimum=min(values),
-            maximum=max(values),
-            mean=mean(values),
-            std=pstdev(values),
+            count=count,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            std=math.sqrt(m2 / count),
         )
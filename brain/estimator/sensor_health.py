@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from statistics import mean
-from typing import Iterable, Optional
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, Sequence
 
 from brain.contracts import ObservationV1, SensorHealthV1
 from brain.contracts.sensor_health_v1 import FaultType
@@ -63,22 +65,35 @@ SENSOR_CONFIGS = {
 }
 
 
-def _get_value(obs: ObservationV1, sensor_name: str) -> Optional[float]:
-    return getattr(obs, sensor_name, None)
+# (name, config, reading getter) per sensor, resolved once at import.
+_SENSOR_EVALUATORS = tuple(
+    (name, config, attrgetter(name)) for name, config in SENSOR_CONFIGS.items()
+)
+
+
+_timestamp = attrgetter("timestamp")
+
+
+def _window_since(history: Sequence[ObservationV1], cutoff: datetime) -> list[ObservationV1]:
+    # History is chronological (as kept by TimeRingBuffer): binary-search the
+    # start, then copy only the tail. Reading from the end keeps this cheap for
+    # deque-backed views, which cannot be sliced.
+    count = len(history) - bisect_left(history, cutoff, key=_timestamp)
+    window = list(islice(reversed(history), count))
+    window.reverse()
+    return window
 
 
 def _recent_window(
-    history: Iterable[ObservationV1], now: datetime, minutes: int
+    history: Sequence[ObservationV1], now: datetime, minutes: int
 ) -> list[ObservationV1]:
-    cutoff = now - timedelta(minutes=minutes)
-    return [obs for obs in history if obs.timestamp >= cutoff]
+    return _window_since(history, now - timedelta(minutes=minutes))
 
 
 def _history_window(
-    history: Iterable[ObservationV1], now: datetime, hours: int
+    history: Sequence[ObservationV1], now: datetime, hours: int
 ) -> list[ObservationV1]:
-    cutoff = now - timedelta(hours=hours)
-    return [obs for obs in history if obs.timestamp >= cutoff]
+    return _window_since(history, now - timedelta(hours=hours))
 
 
 def _detect_stuck(values: list[float], tolerance: float) -> bool:
@@ -101,35 +116,51 @@ def _detect_jump(
 def _detect_drift(
     values: list[float], timestamps: list[datetime], threshold_per_hour: float
 ) -> bool:
-    if len(values) < 3:
+    n = len(values)
+    if n < 3:
         return False
     base_time = timestamps[0]
-    hours = [(ts - base_time).total_seconds() / 3600.0 for ts in timestamps]
-    if max(hours) == 0:
+    # Timestamps are chronological, so a zero span means every sample shares one instant.
+    if timestamps[-1] == base_time:
         return False
-    mean_x = mean(hours)
-    mean_y = mean(values)
-    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(hours, values))
-    denominator = sum((x - mean_x) ** 2 for x in hours)
+    # One pass accumulating the least-squares moments; no intermediate lists.
+    sum_x = sum_y = sum_xx = sum_xy = 0.0
+    for ts, y in zip(timestamps, values):
+        x = (ts - base_time).total_seconds() / 3600.0
+        sum_x += x
+        sum_y += y
+        sum_xx += x * x
+        sum_xy += x * y
+    denominator = n * sum_xx - sum_x * sum_x
     if denominator == 0:
         return False
-    slope = numerator / denominator
+    slope = (n * sum_xy - sum_x * sum_y) / denominator
     return abs(slope) > threshold_per_hour
 
 
 def evaluate_sensor_health(
     observation: ObservationV1,
-    history: Iterable[ObservationV1],
+    history: Sequence[ObservationV1],
 ) -> list[SensorHealthV1]:
-    """Evaluate per-sensor health using recent history."""
+    """Evaluate per-sensor health using recent history.
+
+    `history` is read in place and may or may not already end with `observation`.
+    """
     now = observation.timestamp
-    history_list = list(history)
-    if not history_list or history_list[-1] is not observation:
-        history_list.append(observation)
+    recent_4h = _history_window(history, now, 4)
+    if history and history[-1] is observation:
+        prev = history[-2] if len(history) >= 2 else None
+    else:
+        prev = history[-1] if history else None
+        recent_4h.append(observation)
+
+    # Windows depend only on `now`, so select them once for every sensor. The
+    # 60-minute stuck window is a suffix of the 4-hour drift window.
+    recent_60 = _recent_window(recent_4h, now, 60)
 
     results: list[SensorHealthV1] = []
-    for name, config in SENSOR_CONFIGS.items():
-        current_value = _get_value(observation, name)
+    for name, config, get_value in _SENSOR_EVALUATORS:
+        current_value = get_value(observation)
 
         if current_value is None:
             fault_state = FaultType.DISCONNECTED
@@ -153,11 +184,8 @@ def evaluate_sensor_health(
             results.append(health)
             continue
 
-        recent_60 = _recent_window(history_list, now, 60)
         recent_values = [
-            _get_value(obs, name)
-            for obs in recent_60
-            if _get_value(obs, name) is not None
+            value for obs in recent_60 if (value := get_value(obs)) is not None
         ]
 
         fault_state = FaultType.NONE
@@ -171,9 +199,8 @@ def evaluate_sensor_health(
             confidence = 0.5
             notes = "Reading unchanged beyond tolerance"
 
-        if len(history_list) >= 2:
-            prev = history_list[-2]
-            prev_value = _get_value(prev, name)
+        if prev is not None:
+            prev_value = get_value(prev)
             if prev_value is not None:
                 delta_minutes = (
                     now - prev.timestamp
@@ -190,17 +217,14 @@ def evaluate_sensor_health(
                     notes = "Unphysical jump detected"
 
         if config.drift_rate_per_hour is not None:
-            recent_4h = _history_window(history_list, now, 4)
-            drift_values = [
-                _get_value(obs, name)
-                for obs in recent_4h
-                if _get_value(obs, name) is not None
-            ]
-            drift_times = [
-                obs.timestamp
-                for obs in recent_4h
-                if _get_value(obs, name) is not None
-            ]
+            # One pass fills both columns, reading each value only once.
+            drift_values: list[float] = []
+            drift_times: list[datetime] = []
+            for obs in recent_4h:
+                value = get_value(obs)
+                if value is not None:
+                    drift_values.append(value)
+                    drift_times.append(obs.timestamp)
             if _detect_drift(
                 drift_values,
                 drift_times,
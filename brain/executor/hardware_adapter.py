@@ -4,13 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
 from typing import Callable, Protocol
 
 from brain.contracts import ActionV1
 from brain.contracts.action_v1 import ActionType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HardwareDispatchResult:
     """Result from dispatching a validated action to an actuator backend."""
 
@@ -49,20 +50,22 @@ class HardwareAdapter(Protocol):
 class HardwareStubAdapter:
     """Deterministic no-op adapter that mimics hardware command routing."""
 
-    _COMMAND_MAP = {
-        ActionType.WATER.value: "WATER_PULSE",
-        ActionType.LIGHT.value: "SET_LIGHT",
-        ActionType.FAN.value: "SET_FAN",
-        ActionType.CO2.value: "CO2_INJECT",
-        ActionType.CIRCULATE.value: "SET_CIRCULATION",
-    }
-
-    @property
-    def adapter_name(self) -> str:
-        return "hardware_stub"
+    adapter_name = "hardware_stub"
+    # Keyed by the str-enum members, so validated ActionV1 action_type strings hit directly.
+    _COMMAND_MAP = MappingProxyType(
+        {
+            ActionType.WATER: "WATER_PULSE",
+            ActionType.LIGHT: "SET_LIGHT",
+            ActionType.FAN: "SET_FAN",
+            ActionType.CO2: "CO2_INJECT",
+            ActionType.CIRCULATE: "SET_CIRCULATION",
+        }
+    )
+    # Bound once; builtin methods do not rebind, so dispatch calls it directly.
+    _lookup_command = _COMMAND_MAP.get
 
     def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
-        command = self._COMMAND_MAP.get(str(action.action_type), "UNKNOWN")
+        command = self._lookup_command(action.action_type, "UNKNOWN")
         return HardwareDispatchResult(
             accepted=True,
             command=command,
@@ -79,20 +82,20 @@ class ProductionScaffoldAdapter:
     TODO(stage-5+): replace deterministic no-op dispatch path with real hardware driver I/O.
     """
 
-    _COMMAND_MAP = {
-        ActionType.WATER.value: "ACTUATOR_WATER_PULSE",
-        ActionType.LIGHT.value: "ACTUATOR_LIGHT_SET",
-        ActionType.FAN.value: "ACTUATOR_FAN_SET",
-        ActionType.CO2.value: "ACTUATOR_CO2_INJECT",
-        ActionType.CIRCULATE.value: "ACTUATOR_CIRCULATION_SET",
-    }
-
-    @property
-    def adapter_name(self) -> str:
-        return "production_scaffold"
+    adapter_name = "production_scaffold"
+    _COMMAND_MAP = MappingProxyType(
+        {
+            ActionType.WATER: "ACTUATOR_WATER_PULSE",
+            ActionType.LIGHT: "ACTUATOR_LIGHT_SET",
+            ActionType.FAN: "ACTUATOR_FAN_SET",
+            ActionType.CO2: "ACTUATOR_CO2_INJECT",
+            ActionType.CIRCULATE: "ACTUATOR_CIRCULATION_SET",
+        }
+    )
+    _lookup_command = _COMMAND_MAP.get
 
     def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
-        command = self._COMMAND_MAP.get(str(action.action_type), "ACTUATOR_UNKNOWN")
+        command = self._lookup_command(action.action_type, "ACTUATOR_UNKNOWN")
         return HardwareDispatchResult(
             accepted=True,
             command=command,
@@ -108,13 +111,11 @@ class ProductionScaffoldAdapter:
 class FlakyStubAdapter:
     """Deterministic flaky adapter used to exercise runtime retry behavior."""
 
+    adapter_name = "flaky_stub"
+
     def __init__(self) -> None:
         self._dispatch_calls = 0
 
-    @property
-    def adapter_name(self) -> str:
-        return "flaky_stub"
-
     def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
         self._dispatch_calls += 1
         if self._dispatch_calls % 2 == 1:
@@ -143,6 +144,8 @@ _ADAPTER_FACTORIES: dict[str, HardwareAdapterFactory] = {
     "production_scaffold": ProductionScaffoldAdapter,
     "flaky_stub": FlakyStubAdapter,
 }
+# Sorted view of the registry names; rebuilt lazily after each registration.
+_sorted_adapter_names: tuple[str, ...] | None = None
 
 
 def register_hardware_adapter(name: str, factory: HardwareAdapterFactory) -> None:
@@ -150,16 +153,25 @@ def register_hardware_adapter(name: str, factory: HardwareAdapterFactory) -> Non
     normalized = name.strip().lower()
     if not normalized:
         raise ValueError("adapter name must be non-empty")
+    global _sorted_adapter_names
     _ADAPTER_FACTORIES[normalized] = factory
+    _sorted_adapter_names = None
 
 
 def available_hardware_adapters() -> tuple[str, ...]:
     """Return sorted registered adapter names."""
-    return tuple(sorted(_ADAPTER_FACTORIES))
+    global _sorted_adapter_names
+    if _sorted_adapter_names is None:
+        _sorted_adapter_names = tuple(sorted(_ADAPTER_FACTORIES))
+    return _sorted_adapter_names
 
 
 def get_hardware_adapter_factory(name: str) -> HardwareAdapterFactory:
     """Lookup adapter factory by name."""
+    # Registered keys are already normalized, so an exact hit needs no string work.
+    factory = _ADAPTER_FACTORIES.get(name)
+    if factory is not None:
+        return factory
     normalized = name.strip().lower()
     try:
         return _ADAPTER_FACTORIES[normalized]
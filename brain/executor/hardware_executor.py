@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from brain.contracts import ActionV1, DeviceStatusV1, ExecutorEventV1, GuardrailResultV1
-from brain.contracts.executor_event_v1 import ExecutorStatus
+from brain.contracts.executor_event_v1 import ExecutorReasonCode, ExecutorStatus
 from brain.contracts.guardrail_result_v1 import GuardrailDecision
 from brain.executor.hardware_adapter import HardwareAdapter
 from brain.executor.hardware_state_machine import (
@@ -16,8 +17,16 @@ from brain.executor.hardware_state_machine import (
 from brain.executor.idempotency import IdempotencyConfig
 from brain.executor.retry_policy import RetryPolicyConfig
 
+_SKIPPED = ExecutorStatus.SKIPPED.value
+_EXECUTED = ExecutorStatus.EXECUTED.value
+_CLIPPED = GuardrailDecision.CLIPPED.value
+_DUPLICATE = ExecutorReasonCode.IDEMPOTENCY_DUPLICATE.value
+_NON_RETRYABLE = ExecutorReasonCode.NON_RETRYABLE_DISPATCH.value
+_CLASS_BLOCKED = ExecutorReasonCode.RETRY_CLASS_NOT_ALLOWED.value
+_EXHAUSTED = ExecutorReasonCode.RETRY_EXHAUSTED.value
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _IdempotencyEntry:
     key: str
     first_seen_at: datetime
@@ -27,6 +36,20 @@ class _IdempotencyEntry:
 class HardwareExecutor:
     """Dispatch effective actions through a hardware adapter abstraction."""
 
+    __slots__ = (
+        "_adapter",
+        "_dispatch",
+        "_retry_policy",
+        "_max_attempts",
+        "_is_retryable",
+        "_backoffs",
+        "_backoff_deltas",
+        "_idempotency",
+        "_state_machine",
+        "_pending_runtime_events",
+        "_idempotency_cache",
+    )
+
     def __init__(
         self,
         adapter: HardwareAdapter,
@@ -37,16 +60,25 @@ class HardwareExecutor:
         if not getattr(adapter, "adapter_name", ""):
             raise ValueError("adapter must define non-empty adapter_name")
         self._adapter = adapter
+        self._dispatch = adapter.dispatch
         self._retry_policy = retry_policy or RetryPolicyConfig()
+        # The policy is frozen, so its limit and methods can be bound once.
+        self._max_attempts = self._retry_policy.max_attempts
+        self._is_retryable = self._retry_policy.is_retryable_error_class
+        # Sized to the policy's capped table, not to max_attempts; retries past
+        # its end reuse the last (capped) entry.
+        self._backoffs = self._retry_policy.backoff_table
+        self._backoff_deltas = tuple(timedelta(seconds=s) for s in self._backoffs)
         self._idempotency = idempotency or IdempotencyConfig()
         self._state_machine = HardwareExecutionStateMachine()
         self._pending_runtime_events: list[ExecutorEventV1] = []
-        self._idempotency_cache: dict[str, _IdempotencyEntry] = {}
+        # Insertion (dispatch) order, so the oldest entry is always at the front.
+        self._idempotency_cache: OrderedDict[str, _IdempotencyEntry] = OrderedDict()
 
     def drain_runtime_events(self) -> list[ExecutorEventV1]:
         """Return and clear queued state-machine/runtime events."""
-        drained = self._pending_runtime_events[:]
-        self._pending_runtime_events.clear()
+        drained = self._pending_runtime_events
+        self._pending_runtime_events = []
         return drained
 
     def _queue_transition_events(
@@ -57,23 +89,23 @@ class HardwareExecutor:
         guardrail_decision: str,
         reason_codes: list[str],
     ) -> None:
-        for transition in transitions:
-            self._pending_runtime_events.append(
-                ExecutorEventV1(
-                    schema_version="executor_event_v1",
-                    timestamp=transition.timestamp,
-                    status=ExecutorStatus.SKIPPED,
-                    action_type=action_type,
-                    guardrail_decision=guardrail_decision,
-                    reason_codes=reason_codes,
-                    duration_seconds=None,
-                    notes=(
-                        "state_transition:"
-                        f"{transition.previous_state.value}"
-                        f"->{transition.next_state.value}:{transition.reason}"
-                    ),
-                )
+        self._pending_runtime_events.extend(
+            ExecutorEventV1.build_trusted(
+                schema_version="executor_event_v1",
+                timestamp=transition.timestamp,
+                status=_SKIPPED,
+                action_type=action_type,
+                guardrail_decision=guardrail_decision,
+                reason_codes=list(reason_codes),
+                duration_seconds=None,
+                notes=(
+                    "state_transition:"
+                    f"{transition.previous_state.value}"
+                    f"->{transition.next_state.value}:{transition.reason}"
+                ),
             )
+            for transition in transitions
+        )
 
     def _append_runtime_event(
         self,
@@ -85,22 +117,38 @@ class HardwareExecutor:
         note: str,
     ) -> None:
         self._pending_runtime_events.append(
-            ExecutorEventV1(
+            ExecutorEventV1.build_trusted(
                 schema_version="executor_event_v1",
                 timestamp=timestamp,
-                status=ExecutorStatus.SKIPPED,
+                status=_SKIPPED,
                 action_type=action_type,
                 guardrail_decision=guardrail_decision,
-                reason_codes=reason_codes,
+                reason_codes=list(reason_codes),
                 duration_seconds=None,
                 notes=note,
             )
         )
 
     def _purge_expired_idempotency(self, *, now: datetime) -> None:
-        expired = [key for key, entry in self._idempotency_cache.items() if entry.expires_at <= now]
-        for key in expired:
-            self._idempotency_cache.pop(key, None)
+        # Entries share one TTL and are inserted in dispatch order, so expiries are
+        # ordered too and the purge can stop at the first live entry. A retry that
+        # was scheduled past a later tick can leave a straggler behind it; lookups
+        # re-check expiry, so that only delays reclaiming its memory.
+        cache = self._idempotency_cache
+        while cache:
+            oldest = next(iter(cache.values()))
+            if oldest.expires_at > now:
+                break
+            cache.popitem(last=False)
+
+    def _lookup_idempotency(self, key: str | None, *, now: datetime) -> _IdempotencyEntry | None:
+        if key is None:
+            return None
+        cached = self._idempotency_cache.get(key)
+        if cached is not None and cached.expires_at <= now:
+            del self._idempotency_cache[key]
+            return None
+        return cached
 
     def execute(
         self,
@@ -111,50 +159,59 @@ class HardwareExecutor:
         now: datetime,
         device_status: DeviceStatusV1 | None = None,
     ) -> ExecutorEventV1:
+        # Events are built without re-validation, so reject naive clocks up front.
+        if now.tzinfo is None:
+            raise ValueError("now must be timezone-aware")
+        proposed_type = str(proposed_action.action_type)
+        decision = guardrail_result.decision
+        reason_codes = guardrail_result.reason_codes
         pre_dispatch_transitions = self._state_machine.observe_telemetry(
             now=now,
             device_status=device_status,
         )
-        self._queue_transition_events(
-            transitions=pre_dispatch_transitions,
-            action_type=str(proposed_action.action_type),
-            guardrail_decision=guardrail_result.decision,
-            reason_codes=guardrail_result.reason_codes,
-        )
+        # Steady-state ticks produce no transitions; skip the helper call then.
+        if pre_dispatch_transitions:
+            self._queue_transition_events(
+                transitions=pre_dispatch_transitions,
+                action_type=proposed_type,
+                guardrail_decision=decision,
+                reason_codes=reason_codes,
+            )
 
         if not self._state_machine.can_execute():
-            return ExecutorEventV1(
+            return ExecutorEventV1.build_trusted(
                 schema_version="executor_event_v1",
                 timestamp=now,
-                status=ExecutorStatus.SKIPPED,
-                action_type=str(proposed_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
+                status=_SKIPPED,
+                action_type=proposed_type,
+                guardrail_decision=decision,
+                reason_codes=list(reason_codes),
                 duration_seconds=None,
                 notes=f"blocked_by_state:{self._state_machine.state.value}",
             )
 
         if effective_action is None:
-            return ExecutorEventV1(
+            return ExecutorEventV1.build_trusted(
                 schema_version="executor_event_v1",
                 timestamp=now,
-                status=ExecutorStatus.SKIPPED,
-                action_type=str(proposed_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
+                status=_SKIPPED,
+                action_type=proposed_type,
+                guardrail_decision=decision,
+                reason_codes=list(reason_codes),
                 duration_seconds=None,
                 notes="skipped_by_guardrails_v1",
             )
 
+        effective_type = str(effective_action.action_type)
         key = effective_action.idempotency_key or proposed_action.idempotency_key
         self._purge_expired_idempotency(now=now)
-        if key is not None and key in self._idempotency_cache:
-            cached = self._idempotency_cache[key]
+        cached = self._lookup_idempotency(key, now=now)
+        if cached is not None:
             self._append_runtime_event(
                 timestamp=now,
-                action_type=str(effective_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
+                action_type=effective_type,
+                guardrail_decision=decision,
+                reason_codes=reason_codes,
                 note=(
                     "idempotency_hit:"
                     f"key={cached.key}:"
@@ -162,42 +219,43 @@ class HardwareExecutor:
                     f"expires_at={cached.expires_at.isoformat()}"
                 ),
             )
-            return ExecutorEventV1(
+            return ExecutorEventV1.build_trusted(
                 schema_version="executor_event_v1",
                 timestamp=now,
-                status=ExecutorStatus.SKIPPED,
-                action_type=str(effective_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes + ["idempotency_duplicate"],
+                status=_SKIPPED,
+                action_type=effective_type,
+                guardrail_decision=decision,
+                reason_codes=[*reason_codes, _DUPLICATE],
                 duration_seconds=None,
                 notes=f"skipped_duplicate_idempotency_key:{key}",
             )
 
         attempt_no = 1
         dispatch_time = now
-        dispatch_result = self._adapter.dispatch(action=effective_action, now=dispatch_time)
+        dispatch_result = self._dispatch(action=effective_action, now=dispatch_time)
         while True:
             post_dispatch_transitions = self._state_machine.observe_dispatch_result(
                 accepted=dispatch_result.accepted,
                 now=dispatch_time,
             )
-            self._queue_transition_events(
-                transitions=post_dispatch_transitions,
-                action_type=str(effective_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
-            )
+            if post_dispatch_transitions:
+                self._queue_transition_events(
+                    transitions=post_dispatch_transitions,
+                    action_type=effective_type,
+                    guardrail_decision=decision,
+                    reason_codes=reason_codes,
+                )
             if dispatch_result.accepted:
                 break
 
             if not dispatch_result.retryable:
-                return ExecutorEventV1(
+                return ExecutorEventV1.build_trusted(
                     schema_version="executor_event_v1",
                     timestamp=dispatch_time,
-                    status=ExecutorStatus.SKIPPED,
-                    action_type=str(effective_action.action_type),
-                    guardrail_decision=guardrail_result.decision,
-                    reason_codes=guardrail_result.reason_codes + ["non_retryable_dispatch"],
+                    status=_SKIPPED,
+                    action_type=effective_type,
+                    guardrail_decision=decision,
+                    reason_codes=[*reason_codes, _NON_RETRYABLE],
                     duration_seconds=None,
                     notes=(
                         "adapter_rejected_non_retryable:"
@@ -206,14 +264,14 @@ class HardwareExecutor:
                     ),
                 )
 
-            if not self._retry_policy.is_retryable_error_class(dispatch_result.error_class):
-                return ExecutorEventV1(
+            if not self._is_retryable(dispatch_result.error_class):
+                return ExecutorEventV1.build_trusted(
                     schema_version="executor_event_v1",
                     timestamp=dispatch_time,
-                    status=ExecutorStatus.SKIPPED,
-                    action_type=str(effective_action.action_type),
-                    guardrail_decision=guardrail_result.decision,
-                    reason_codes=guardrail_result.reason_codes + ["retry_class_not_allowed"],
+                    status=_SKIPPED,
+                    action_type=effective_type,
+                    guardrail_decision=decision,
+                    reason_codes=[*reason_codes, _CLASS_BLOCKED],
                     duration_seconds=None,
                     notes=(
                         "adapter_rejected_class_blocked:"
@@ -222,14 +280,14 @@ class HardwareExecutor:
                     ),
                 )
 
-            if attempt_no >= self._retry_policy.max_attempts:
-                return ExecutorEventV1(
+            if attempt_no >= self._max_attempts:
+                return ExecutorEventV1.build_trusted(
                     schema_version="executor_event_v1",
                     timestamp=dispatch_time,
-                    status=ExecutorStatus.SKIPPED,
-                    action_type=str(effective_action.action_type),
-                    guardrail_decision=guardrail_result.decision,
-                    reason_codes=guardrail_result.reason_codes + ["retry_exhausted"],
+                    status=_SKIPPED,
+                    action_type=effective_type,
+                    guardrail_decision=decision,
+                    reason_codes=[*reason_codes, _EXHAUSTED],
                     duration_seconds=None,
                     notes=(
                         "adapter_rejected_retry_exhausted:"
@@ -239,13 +297,14 @@ class HardwareExecutor:
                 )
 
             retry_no = attempt_no
-            backoff_seconds = self._retry_policy.backoff_seconds_for_retry(retry_no)
-            retry_at = dispatch_time + timedelta(seconds=backoff_seconds)
+            backoff_index = min(retry_no, len(self._backoffs)) - 1
+            backoff_seconds = self._backoffs[backoff_index]
+            retry_at = dispatch_time + self._backoff_deltas[backoff_index]
             self._append_runtime_event(
                 timestamp=dispatch_time,
-                action_type=str(effective_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
+                action_type=effective_type,
+                guardrail_decision=decision,
+                reason_codes=reason_codes,
                 note=(
                     "retry_scheduled:"
                     f"adapter={dispatch_result.adapter_name}:"
@@ -257,9 +316,9 @@ class HardwareExecutor:
 
             attempt_no += 1
             dispatch_time = retry_at
-            dispatch_result = self._adapter.dispatch(action=effective_action, now=dispatch_time)
+            dispatch_result = self._dispatch(action=effective_action, now=dispatch_time)
 
-        clipped = guardrail_result.decision == GuardrailDecision.CLIPPED.value
+        clipped = decision == _CLIPPED
         if clipped:
             note = (
                 "executed_after_retry_"
@@ -279,11 +338,7 @@ class HardwareExecutor:
 
         if key is not None:
             if len(self._idempotency_cache) >= self._idempotency.max_entries:
-                oldest_key = min(
-                    self._idempotency_cache,
-                    key=lambda k: self._idempotency_cache[k].first_seen_at,
-                )
-                self._idempotency_cache.pop(oldest_key, None)
+                self._idempotency_cache.popitem(last=False)
             expires_at = dispatch_time + timedelta(seconds=self._idempotency.ttl_seconds)
             self._idempotency_cache[key] = _IdempotencyEntry(
                 key=key,
@@ -292,19 +347,19 @@ class HardwareExecutor:
             )
             self._append_runtime_event(
                 timestamp=dispatch_time,
-                action_type=str(effective_action.action_type),
-                guardrail_decision=guardrail_result.decision,
-                reason_codes=guardrail_result.reason_codes,
+                action_type=effective_type,
+                guardrail_decision=decision,
+                reason_codes=reason_codes,
                 note=f"idempotency_stored:key={key}:expires_at={expires_at.isoformat()}",
             )
 
-        return ExecutorEventV1(
+        return ExecutorEventV1.build_trusted(
             schema_version="executor_event_v1",
             timestamp=dispatch_time,
-            status=ExecutorStatus.EXECUTED,
-            action_type=str(effective_action.action_type),
-            guardrail_decision=guardrail_result.decision,
-            reason_codes=guardrail_result.reason_codes,
+            status=_EXECUTED,
+            action_type=effective_type,
+            guardrail_decision=decision,
+            reason_codes=list(reason_codes),
             duration_seconds=dispatch_result.duration_seconds,
             notes=note,
         )
@@ -18,7 +18,12 @@ class ExecutorRuntimeState(str, Enum):
     SAFE_MODE = "safe_mode"
 
 
-@dataclass(frozen=True)
+# Built once: a set display of enum members is rebuilt, and re-hashed, per call.
+_EXECUTABLE_STATES = frozenset({ExecutorRuntimeState.NOMINAL, ExecutorRuntimeState.DEGRADED})
+_RECOVERABLE_STATES = frozenset({ExecutorRuntimeState.DEGRADED, ExecutorRuntimeState.FAULTED})
+
+
+@dataclass(frozen=True, slots=True)
 class StateTransition:
     """Single state transition event."""
 
@@ -28,7 +33,7 @@ class StateTransition:
     timestamp: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateMachineConfig:
     """Thresholds for deterministic state transitions."""
 
@@ -53,10 +58,7 @@ class HardwareExecutionStateMachine:
         return self._state
 
     def can_execute(self) -> bool:
-        return self._state in {
-            ExecutorRuntimeState.NOMINAL,
-            ExecutorRuntimeState.DEGRADED,
-        }
+        return self._state in _EXECUTABLE_STATES
 
     def observe_telemetry(
         self,
@@ -124,7 +126,7 @@ class HardwareExecutionStateMachine:
             return transitions
 
         if (
-            self._state in {ExecutorRuntimeState.DEGRADED, ExecutorRuntimeState.FAULTED}
+            self._state in _RECOVERABLE_STATES
             and self._consecutive_adapter_errors == 0
             and self._consecutive_healthy_cycles >= self._config.healthy_cycles_for_recovery
         ):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 
@@ -30,19 +31,41 @@ class RetryPolicyConfig:
             raise ValueError("max_backoff_seconds must be >= 0")
         if self.base_backoff_seconds > self.max_backoff_seconds:
             raise ValueError("base_backoff_seconds cannot exceed max_backoff_seconds")
+        # Hashed view of the public tuple; a plain attribute, not a dataclass field,
+        # so it stays out of fields(), asdict(), repr and equality.
+        object.__setattr__(self, "_retryable_set", frozenset(self.retryable_error_classes))
+        # Backoffs for retries 1..max_attempts, truncated once the cap is reached
+        # since every later retry reuses the capped value.
+        table: list[float] = []
+        for retry_index in range(1, self.max_attempts + 1):
+            try:
+                raw = self.base_backoff_seconds * (self.backoff_multiplier ** (retry_index - 1))
+            except OverflowError:
+                raw = math.inf
+            backoff = min(raw, self.max_backoff_seconds)
+            table.append(backoff)
+            if backoff >= self.max_backoff_seconds:
+                break
+        object.__setattr__(self, "_backoff_table", tuple(table))
+
+    @property
+    def backoff_table(self) -> tuple[float, ...]:
+        """Backoff seconds for retries 1..n; later retries reuse the last entry."""
+        return self._backoff_table
 
     def backoff_seconds_for_retry(self, retry_index: int) -> float:
         """
         Return deterministic backoff seconds for retry index.
 
-        retry_index is 1-based for retry attempts after the initial dispatch.
+        retry_index is 1-based for retry attempts after the initial dispatch;
+        indices past the precomputed table reuse its last entry.
         """
         if retry_index < 1:
             raise ValueError("retry_index must be >= 1")
-        raw = self.base_backoff_seconds * (self.backoff_multiplier ** (retry_index - 1))
-        return min(raw, self.max_backoff_seconds)
+        table = self._backoff_table
+        return table[min(retry_index, len(table)) - 1]
 
     def is_retryable_error_class(self, error_class: str | None) -> bool:
         if error_class is None:
             return False
-        return error_class in self.retryable_error_classes
+        return error_class in self._retryable_set
@@ -152,11 +152,5 @@ class GuardrailsValidator:
 
     @staticmethod
     def _dedupe_codes(codes: list[GuardrailReasonCode]) -> list[GuardrailReasonCode]:
-        seen: set[GuardrailReasonCode] = set()
-        ordered: list[GuardrailReasonCode] = []
-        for code in codes:
-            if code in seen:
-                continue
-            seen.add(code)
-            ordered.append(code)
-        return ordered
+        # dict keys keep first-insertion order, so this is an ordered dedupe.
+        return list(dict.fromkeys(codes))
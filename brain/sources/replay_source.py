@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional, TextIO
+from typing import BinaryIO, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from brain.contracts import DeviceStatusV1, ObservationV1
 
 logger = logging.getLogger(__name__)
 
 
+class _ReplayRecord(BaseModel):
+    """One replay JSONL line: an observation plus its device status."""
+
+    model_config = ConfigDict(strict=True)
+
+    observation: ObservationV1
+    device_status: DeviceStatusV1
+
+
+_REPLAY_RECORD_ADAPTER = TypeAdapter(_ReplayRecord)
+# Bound once so each line is validated straight from the raw bytes, without
+# a str decode, an intermediate dict, or per-call attribute lookups.
+_validate_record_json = _REPLAY_RECORD_ADAPTER.validate_json
+
+
 class ReplaySource:
     """Replay ObservationV1 + DeviceStatusV1 records from JSONL.
 
@@ -32,22 +47,12 @@ class ReplaySource:
             )
         self._path = Path(path)
         self._policy = malformed_policy
-        self._handle: Optional[TextIO] = None
+        self._handle: Optional[BinaryIO] = None
         self._line_no = 0
 
     def _ensure_open(self) -> None:
         if self._handle is None:
-            self._handle = self._path.open("r", encoding="utf-8")
-
-    @staticmethod
-    def _parse_timestamp(value):
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            if value.endswith("Z"):
-                value = value[:-1] + "+00:00"
-            return datetime.fromisoformat(value)
-        return value
+            self._handle = self._path.open("rb")
 
     def next_observation(
         self,
@@ -56,27 +61,15 @@ class ReplaySource:
         assert self._handle is not None
         while True:
             line = self._handle.readline()
-            if line == "":
+            if not line:
                 return None
             self._line_no += 1
             line = line.strip()
             if not line:
                 continue
             try:
-                payload = json.loads(line)
-                observation_payload = payload["observation"]
-                device_payload = payload["device_status"]
-                if "timestamp" in observation_payload:
-                    observation_payload["timestamp"] = self._parse_timestamp(
-                        observation_payload["timestamp"]
-                    )
-                if "timestamp" in device_payload:
-                    device_payload["timestamp"] = self._parse_timestamp(
-                        device_payload["timestamp"]
-                    )
-                observation = ObservationV1(**observation_payload)
-                device_status = DeviceStatusV1(**device_payload)
-                return observation, device_status
+                record = _validate_record_json(line)
+                return record.observation, record.device_status
             except Exception as exc:  # noqa: BLE001
                 if self._policy == "fail_fast":
                     raise ValueError(
@@ -2,6 +2,8 @@ import json
 from pathlib import Path
 from typing import Iterable
 
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 def export_public_subset(
     input_file: str | Path,
@@ -29,4 +31,4 @@ def export_public_subset(
                 # skip malformed lines
                 continue
             filtered = {k: v for k, v in obj.items() if k in wl}
-            outf.write(json.dumps(filtered, ensure_ascii=False) + "\n")
+            outf.write(_ENCODER.encode(filtered) + "\n")
@@ -4,6 +4,10 @@ import os
 from pathlib import Path
 from typing import Any, Optional
 
+# ``json.dumps`` builds a fresh encoder whenever non-default options are
+# passed; reuse a single one so every append goes straight to the C encoder.
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class JSONLWriter:
     """Simple JSONL writer with configurable fsync and basic rotation helpers.
@@ -23,7 +27,7 @@ class JSONLWriter:
             self._path.parent.mkdir(parents=True, exist_ok=True)
 
     def append(self, record: Any) -> None:
-        line = json.dumps(record, ensure_ascii=False) + "\n"
+        line = _ENCODER.encode(record) + "\n"
         # Open, write, flush, and optionally fsync on every append to ensure
         # durability and predictable behavior across platforms.
         with open(self._path, "a", encoding=self._encoding) as f:
@@ -56,7 +56,7 @@ class BaselineVisionAnalyzer:
             stress_signals=_sorted_unique(stress_signals),
         )
 
-        explanation = VisionExplanationV1(
+        explanation = VisionExplanationV1.build_trusted(
             schema_version="vision_explanation_v1",
             timestamp=payload.timestamp,
             image_ref=payload.image_ref,
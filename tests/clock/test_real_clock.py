@@ -9,3 +9,12 @@ def test_real_clock_monotonicity():
     clock.sleep(0.01)
     second = clock.now()
     assert second >= first
+
+
+def test_real_clock_now_ns_matches_now():
+    clock = RealClock()
+    before = clock.now_ns()
+    now = clock.now()
+    after = clock.now_ns()
+    assert after >= before
+    assert abs(now.timestamp() * 1_000_000_000 - before) < 1_000_000_000
@@ -12,3 +12,35 @@ def test_sim_clock_advances_by_scale():
     clock.sleep(1.5)
 
     assert clock.now() == start + timedelta(seconds=180)
+
+
+def test_sim_clock_accumulates_sub_microsecond_steps():
+    start = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    clock = SimClock(start_time=start)
+
+    for _ in range(10):
+        clock.sleep_for_logical(1e-7)
+
+    assert clock.now() == start + timedelta(microseconds=1)
+    assert clock.now() is clock.now()
+
+
+def test_sim_clock_sleep_ticks_matches_repeated_sleep():
+    start = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    stepped = SimClock(time_scale=60.0, start_time=start)
+    bulk = SimClock(time_scale=60.0, start_time=start)
+
+    for _ in range(1000):
+        stepped.sleep(0.0137)
+    bulk.sleep_ticks(0.0137, 1000)
+
+    assert bulk.now() == stepped.now()
+
+
+def test_sim_clock_now_ns_tracks_now():
+    start = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    clock = SimClock(time_scale=2.0, start_time=start)
+
+    assert clock.now_ns() == int(start.timestamp()) * 1_000_000_000
+    clock.sleep(0.25)
+    assert clock.now_ns() - int(start.timestamp()) * 1_000_000_000 == 500_000_000
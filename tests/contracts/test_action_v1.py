@@ -129,3 +129,25 @@ class TestActionV1Serialization:
         assert isinstance(schema, dict)
         assert "properties" in schema
         assert "action_type" in schema["properties"]
+
+    def test_build_trusted_matches_validated_dump(self):
+        """Trusted construction should dump identically to a validated model."""
+        now = datetime.now(timezone.utc)
+        validated = ActionV1(
+            schema_version="action_v1",
+            timestamp=now,
+            action_type=ActionType.WATER,
+            duration_seconds=12.5,
+            intensity=0.8,
+            reason="Soil moisture p1 below target",
+        )
+        trusted = ActionV1.build_trusted(
+            schema_version="action_v1",
+            timestamp=now,
+            action_type=ActionType.WATER.value,
+            duration_seconds=12.5,
+            intensity=0.8,
+            reason="Soil moisture p1 below target",
+        )
+        assert trusted.model_dump(mode="json") == validated.model_dump(mode="json")
+        assert ActionV1.model_validate_json(trusted.model_dump_json()) == validated
@@ -6,8 +6,8 @@ import pytest
 from pydantic import ValidationError
 
 from brain.contracts import ExecutorEventV1
-from brain.contracts.executor_event_v1 import ExecutorStatus
-from brain.contracts.guardrail_result_v1 import GuardrailDecision
+from brain.contracts.executor_event_v1 import ExecutorReasonCode, ExecutorStatus
+from brain.contracts.guardrail_result_v1 import GuardrailDecision, GuardrailReasonCode
 
 
 def test_valid_executor_event_passes():
@@ -45,6 +45,31 @@ def test_schema_version_is_fixed():
         )
 
 
+def test_reason_codes_accept_guardrail_and_executor_codes():
+    event = ExecutorEventV1(
+        schema_version="executor_event_v1",
+        timestamp=datetime.now(timezone.utc),
+        status=ExecutorStatus.SKIPPED,
+        action_type="water",
+        guardrail_decision=GuardrailDecision.CLIPPED,
+        reason_codes=[
+            GuardrailReasonCode.ACTION_CLIPPED,
+            ExecutorReasonCode.RETRY_EXHAUSTED,
+        ],
+    )
+    assert event.reason_codes == ["action_clipped", "retry_exhausted"]
+
+    with pytest.raises(ValidationError):
+        ExecutorEventV1(
+            schema_version="executor_event_v1",
+            timestamp=datetime.now(timezone.utc),
+            status=ExecutorStatus.SKIPPED,
+            action_type="water",
+            guardrail_decision=GuardrailDecision.REJECTED,
+            reason_codes=["made_up_code"],
+        )
+
+
 def test_json_roundtrip():
     original = ExecutorEventV1(
         schema_version="executor_event_v1",
@@ -55,3 +80,21 @@ def test_json_roundtrip():
     )
     restored = ExecutorEventV1.model_validate_json(original.model_dump_json())
     assert restored.model_dump(mode="json") == original.model_dump(mode="json")
+
+
+def test_build_trusted_matches_validated_event():
+    fields = dict(
+        schema_version="executor_event_v1",
+        timestamp=datetime.now(timezone.utc),
+        action_type="water",
+        guardrail_decision=GuardrailDecision.CLIPPED.value,
+        duration_seconds=8.0,
+        notes="executed_hardware_stub_clipped:WATER_PULSE",
+    )
+    codes = [GuardrailReasonCode.ACTION_CLIPPED.value, ExecutorReasonCode.RETRY_EXHAUSTED.value]
+    validated = ExecutorEventV1(status=ExecutorStatus.EXECUTED, reason_codes=codes, **fields)
+    trusted = ExecutorEventV1.build_trusted(
+        status=ExecutorStatus.EXECUTED.value, reason_codes=list(codes), **fields
+    )
+    assert trusted == validated
+    assert trusted.model_dump(mode="json") == validated.model_dump(mode="json")
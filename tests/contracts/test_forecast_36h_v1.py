@@ -60,3 +60,31 @@ def test_forecast_requires_ordered_timestamps():
             horizon_hours=36,
             points=[_point(base + timedelta(hours=1)), _point(base)],
         )
+
+
+def test_forecast_rejects_duplicate_timestamps():
+    base = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    with pytest.raises(ValidationError):
+        Forecast36hV1(
+            schema_version="forecast_36h_v1",
+            generated_at=base,
+            source="test",
+            timezone="Europe/Vienna",
+            freq_minutes=60,
+            horizon_hours=36,
+            points=[_point(base), _point(base)],
+        )
+
+
+def test_build_trusted_matches_validated_forecast():
+    base = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    data = dict(
+        schema_version="forecast_36h_v1",
+        generated_at=base,
+        source="test",
+        timezone="Europe/Vienna",
+        freq_minutes=60,
+        horizon_hours=36,
+        points=[_point(base), _point(base + timedelta(hours=1))],
+    )
+    assert Forecast36hV1.build_trusted(**data) == Forecast36hV1(**data)
@@ -34,3 +34,11 @@ def test_all_contracts_are_importable():
     assert VisionV1 is not None
     assert VisionExplanationV1 is not None
     assert SensorHealthV1 is not None
+
+
+def test_list_adapter_is_a_shared_singleton():
+    """The package-level list adapter is the module-level instance."""
+    import brain.contracts as contracts
+    from brain.contracts import _adapters
+
+    assert contracts.OBSERVATION_V1_LIST_ADAPTER is _adapters.OBSERVATION_V1_LIST_ADAPTER
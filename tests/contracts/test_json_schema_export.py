@@ -19,6 +19,10 @@ from brain.contracts import (
     VisionV1,
     WeatherAdapterLogV1,
 )
+from brain.contracts.action_v1 import ActionType
+from brain.contracts.anomaly_v1 import AnomalyType, SeverityLevel
+from brain.contracts.executor_event_v1 import ExecutorStatus
+from brain.contracts.guardrail_result_v1 import GuardrailDecision, GuardrailReasonCode
 
 
 class TestJsonSchemaExport:
@@ -76,6 +80,27 @@ class TestJsonSchemaExport:
             action_types = props["action_type"]["enum"]
             assert "water" in action_types
 
+    @pytest.mark.parametrize(
+        ("contract", "field", "enum"),
+        [
+            (ActionV1, "action_type", ActionType),
+            (AnomalyV1, "anomaly_type", AnomalyType),
+            (AnomalyV1, "severity", SeverityLevel),
+            (ExecutorEventV1, "status", ExecutorStatus),
+            (GuardrailResultV1, "decision", GuardrailDecision),
+        ],
+    )
+    def test_literal_fields_match_enum_values(self, contract, field, enum):
+        """Literal-typed fields must accept exactly the enum's values."""
+        props = contract.model_json_schema()["properties"]
+        assert props[field]["enum"] == [member.value for member in enum]
+
+    def test_reason_codes_match_enum_values(self):
+        props = GuardrailResultV1.model_json_schema()["properties"]
+        assert props["reason_codes"]["items"]["enum"] == [
+            member.value for member in GuardrailReasonCode
+        ]
+
     def test_schemas_are_serializable(self):
         """All schemas should be JSON serializable."""
         for contract in [
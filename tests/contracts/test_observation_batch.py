@@ -0,0 +1,62 @@
+"""Tests for the ObservationBatch column store."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from brain.contracts import (
+    OBSERVATION_V1_LIST_ADAPTER,
+    ObservationBatch,
+    ObservationV1,
+)
+
+
+def _obs(i: int, *, p2: float | None = None) -> ObservationV1:
+    return ObservationV1(
+        schema_version="observation_v1",
+        timestamp=datetime(2026, 2, 15, tzinfo=timezone.utc) + timedelta(minutes=i),
+        soil_moisture_p1=0.5 + i * 0.01,
+        soil_moisture_p2=p2,
+        air_temperature=21.0 + i,
+        air_humidity=60.0,
+        co2_ppm=410.0 if i % 2 == 0 else None,
+    )
+
+
+def test_from_models_stores_columns_and_roundtrips():
+    observations = [_obs(0, p2=0.4), _obs(1), _obs(2, p2=0.45)]
+    batch = ObservationBatch.from_models(observations)
+
+    assert len(batch) == 3
+    assert list(batch.air_temperature) == [21.0, 22.0, 23.0]
+    assert batch.soil_moisture_p2[0] == 0.4
+    assert math.isnan(batch.soil_moisture_p2[1])
+    assert math.isnan(batch.co2_ppm[1])
+    assert all(math.isnan(value) for value in batch.light_intensity)
+    assert batch.to_models() == observations
+
+
+def test_from_jsonl_validates_each_line(tmp_path):
+    observations = [_obs(0), _obs(1)]
+    path = tmp_path / "observations.jsonl"
+    path.write_text(
+        "\n".join(obs.model_dump_json() for obs in observations) + "\n\n",
+        encoding="utf-8",
+    )
+
+    batch = ObservationBatch.from_jsonl(path)
+    assert batch.to_models() == observations
+
+    path.write_text('{"schema_version": "observation_v1"}\n', encoding="utf-8")
+    with pytest.raises(ValidationError):
+        ObservationBatch.from_jsonl(path)
+
+
+def test_list_adapter_validates_json_arrays():
+    observations = [_obs(0), _obs(1)]
+    payload = "[" + ",".join(obs.model_dump_json() for obs in observations) + "]"
+
+    assert OBSERVATION_V1_LIST_ADAPTER.validate_json(payload) == observations
+    assert OBSERVATION_V1_LIST_ADAPTER.validate_json("[]") == []
@@ -56,6 +56,19 @@ class TestObservationV1Valid:
         )
         assert obs.sensor_faults == {"soil_p1": False, "air_temp": True}
 
+    def test_observation_is_immutable(self):
+        """Persisted records are frozen; use model_copy(update=...) instead."""
+        obs = ObservationV1(
+            schema_version="observation_v1",
+            timestamp=datetime.now(timezone.utc),
+            soil_moisture_p1=0.5,
+            air_temperature=22.0,
+            air_humidity=60.0,
+        )
+        with pytest.raises(ValidationError):
+            obs.soil_moisture_p1 = 0.9
+        assert obs.model_copy(update={"soil_moisture_p1": 0.9}).soil_moisture_p1 == 0.9
+
 
 class TestObservationV1Invalid:
     """Test invalid ObservationV1 payloads."""
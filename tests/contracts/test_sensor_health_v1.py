@@ -115,8 +115,9 @@ class TestSensorHealthV1Serialization:
         json_str = original.model_dump_json()
         restored = SensorHealthV1.model_validate_json(json_str)
         assert restored.sensor_name == original.sensor_name
-        assert restored.fault_state == original.fault_state
+        assert restored.fault_state is FaultType.NONE
         assert restored.confidence == original.confidence
+        assert original.model_dump(mode="json")["fault_state"] == "none"
 
     def test_json_schema_export(self):
         """SensorHealthV1 should export valid JSON Schema."""
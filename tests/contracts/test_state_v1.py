@@ -177,6 +177,22 @@ class TestStateV1Serialization:
         assert restored.soil_moisture_p1 == original.soil_moisture_p1
         assert restored.timestamp == original.timestamp
 
+    def test_build_trusted_matches_validated_dump(self):
+        """Trusted construction should dump identically to a validated model."""
+        fields = dict(
+            schema_version="state_v1",
+            timestamp=datetime.now(timezone.utc),
+            soil_moisture_p1=0.4,
+            soil_moisture_avg=0.4,
+            air_temperature=21.0,
+            air_humidity=60.0,
+            vpd=0.9,
+            confidence=0.7,
+        )
+        trusted = StateV1.build_trusted(**fields)
+        assert trusted.model_dump(mode="json") == StateV1(**fields).model_dump(mode="json")
+        assert StateV1.model_validate_json(trusted.model_dump_json()) == trusted
+
     def test_json_schema_export(self):
         """StateV1 should export valid JSON Schema."""
         schema = StateV1.model_json_schema()
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 
 from brain.control import BaselineWaterController
-from brain.contracts import StateV1
+from brain.contracts import ActionV1, StateV1
 
 
 def _make_state(soil_moisture_p1: float) -> StateV1:
@@ -44,6 +44,26 @@ def test_water_action_when_soil_is_below_threshold():
     assert "Stage 2 water-only policy" in action.reason
 
 
+def test_reason_formatting_can_be_disabled():
+    state = _make_state(soil_moisture_p1=0.20)
+
+    detailed = BaselineWaterController().propose_action(state)
+    terse = BaselineWaterController(include_reason=False).propose_action(state)
+
+    assert detailed is not None and terse is not None
+    assert "0.200" in detailed.reason
+    assert "0.200" not in terse.reason
+    assert terse.model_dump(exclude={"reason"}) == detailed.model_dump(exclude={"reason"})
+
+
+def test_trusted_action_passes_full_validation():
+    controller = BaselineWaterController()
+    action = controller.propose_action(_make_state(soil_moisture_p1=0.10))
+
+    assert action is not None
+    assert ActionV1.model_validate(action.model_dump()) == action
+
+
 def test_action_output_is_deterministic_for_identical_inputs():
     controller = BaselineWaterController()
     state = _make_state(soil_moisture_p1=0.25)
@@ -2,8 +2,11 @@
 
 from datetime import datetime, timedelta, timezone
 
-from brain.contracts import DeviceStatusV1, ObservationV1
-from brain.contracts.anomaly_v1 import AnomalyType
+import pytest
+
+from brain.contracts import AnomalyV1, DeviceStatusV1, ObservationV1, SensorHealthV1
+from brain.contracts.anomaly_v1 import AnomalyType, SeverityLevel
+from brain.contracts.sensor_health_v1 import FaultType
 from brain.estimator.anomaly_detector import THRESHOLDS, detect_anomalies
 
 
@@ -64,6 +67,21 @@ def test_all_thresholds_specified_in_spec():
     assert expected.issubset(THRESHOLDS.keys())
 
 
+def test_trusted_anomalies_pass_full_validation():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    obs = _make_observation(now, soil_p1=0.05)
+    offline = _device_status(now).model_copy(update={"mcu_connected": False})
+    anomalies = detect_anomalies(
+        obs,
+        vpd_kpa=4.0,
+        sensor_health=[],
+        device_status=offline,
+    )
+    assert len(anomalies) >= 3
+    for anomaly in anomalies:
+        assert AnomalyV1.model_validate(anomaly.model_dump()) == anomaly
+
+
 def test_sustained_threshold_trigger():
     now = datetime(2026, 2, 15, 0, 30, tzinfo=timezone.utc)
     prev = _make_observation(now - timedelta(minutes=15), soil_p1=0.05)
@@ -81,6 +99,25 @@ def test_sustained_threshold_trigger():
     assert any((a.notes or "").endswith("sustained") for a in moisture)
 
 
+def test_history_with_or_without_current_observation_matches():
+    now = datetime(2026, 2, 15, 0, 30, tzinfo=timezone.utc)
+    prev = _make_observation(now - timedelta(minutes=15), soil_p1=0.05)
+    obs = _make_observation(now, soil_p1=0.05)
+
+    results = [
+        detect_anomalies(
+            obs,
+            vpd_kpa=1.2,
+            sensor_health=[],
+            device_status=_device_status(now),
+            history=history,
+        )
+        for history in ([prev, obs], [prev], (item for item in [prev]))
+    ]
+    dumps = [[a.model_dump(mode="json") for a in result] for result in results]
+    assert dumps[0] == dumps[1] == dumps[2]
+
+
 def test_rate_of_change_trigger():
     now = datetime(2026, 2, 15, 0, 10, tzinfo=timezone.utc)
     prev = ObservationV1(
@@ -126,3 +163,80 @@ def test_no_false_positive_for_short_spikes():
     moisture = [a for a in anomalies if a.anomaly_type == AnomalyType.MOISTURE_STRESS]
     assert moisture
     assert all((a.notes or "").endswith("instant") for a in moisture)
+
+
+def test_sustained_windows_differ_per_threshold():
+    now = datetime(2026, 2, 15, 1, 0, tzinfo=timezone.utc)
+    older = _make_observation(now - timedelta(minutes=25), soil_p1=0.05).model_copy(
+        update={"air_temperature": 35.0}
+    )
+    obs = _make_observation(now, soil_p1=0.05).model_copy(update={"air_temperature": 35.0})
+    anomalies = detect_anomalies(
+        obs,
+        vpd_kpa=1.2,
+        sensor_health=[],
+        device_status=_device_status(now),
+        history=[older, obs],
+    )
+    moisture = [a for a in anomalies if a.anomaly_type == AnomalyType.MOISTURE_STRESS]
+    temperature = [a for a in anomalies if a.anomaly_type == AnomalyType.TEMPERATURE_STRESS]
+    # 25 minutes back is inside the 30-minute soil window but outside the 20-minute one.
+    assert any((a.notes or "").endswith("sustained") for a in moisture)
+    assert temperature
+    assert all((a.notes or "").endswith("instant") for a in temperature)
+
+
+@pytest.mark.parametrize(
+    ("fault", "anomaly_type", "severity"),
+    [
+        (FaultType.STUCK, AnomalyType.SENSOR_STUCK, SeverityLevel.MEDIUM),
+        (FaultType.JUMP, AnomalyType.SENSOR_JUMP, SeverityLevel.HIGH),
+        (FaultType.DRIFT, AnomalyType.SENSOR_DRIFT, SeverityLevel.MEDIUM),
+        (FaultType.DISCONNECTED, AnomalyType.SENSOR_DISCONNECT, SeverityLevel.HIGH),
+        (FaultType.OUT_OF_RANGE, AnomalyType.UNKNOWN, SeverityLevel.LOW),
+    ],
+)
+def test_sensor_fault_maps_to_anomaly(fault, anomaly_type, severity):
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    health = SensorHealthV1(
+        schema_version="sensor_health_v1",
+        timestamp=now,
+        sensor_name="soil_moisture_p1",
+        status="degraded",
+        confidence=0.5,
+        fault_state=fault,
+        readings_since_fault=0,
+    )
+    anomalies = detect_anomalies(
+        _make_observation(now, soil_p1=0.5),
+        vpd_kpa=1.2,
+        sensor_health=[health],
+        device_status=_device_status(now),
+    )
+    faults = [a for a in anomalies if a.affected_sensor == "soil_moisture_p1"]
+    assert [(a.anomaly_type, a.severity) for a in faults] == [(anomaly_type, severity)]
+    assert faults[0].description == f"Sensor fault detected: {fault.value}"
+
+
+def test_unknown_fault_string_is_reported_with_defaults():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    health = SensorHealthV1.model_construct(
+        schema_version="sensor_health_v1",
+        timestamp=now,
+        sensor_name="soil_moisture_p1",
+        status="degraded",
+        confidence=0.5,
+        fault_state="flatline",
+        readings_since_fault=0,
+    )
+    anomalies = detect_anomalies(
+        _make_observation(now, soil_p1=0.5),
+        vpd_kpa=1.2,
+        sensor_health=[health],
+        device_status=_device_status(now),
+    )
+    faults = [a for a in anomalies if a.affected_sensor == "soil_moisture_p1"]
+    assert [(a.anomaly_type, a.severity) for a in faults] == [
+        (AnomalyType.UNKNOWN, SeverityLevel.LOW)
+    ]
+    assert faults[0].description == "Sensor fault detected: flatline"
@@ -1,11 +1,14 @@
 ﻿"""Tests for confidence scoring."""
 
 from datetime import datetime, timedelta, timezone
+from statistics import pstdev
+
+import pytest
 
 from brain.contracts import AnomalyV1, ObservationV1, SensorHealthV1
 from brain.contracts.anomaly_v1 import AnomalyType, SeverityLevel
 from brain.contracts.sensor_health_v1 import FaultType
-from brain.estimator.confidence import compute_confidence
+from brain.estimator.confidence import _history_stdevs, compute_confidence
 
 
 def _make_observation(timestamp: datetime, soil_p2=None) -> ObservationV1:
@@ -89,3 +92,41 @@ def test_confidence_algorithm_matches_spec():
 
     # age(25)=0.10 + stuck(0.50) + minor anomaly(0.10) => 0.30 confidence
     assert abs(confidence - 0.30) < 1e-6
+
+
+def test_confidence_saturates_without_reading_remaining_inputs():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    stale = _make_observation(now - timedelta(hours=2)).model_copy(
+        update={"soil_moisture_p1": 0.05, "air_temperature": 35.0, "air_humidity": 5.0}
+    )
+
+    class _Untouchable:
+        def __iter__(self):
+            raise AssertionError("iterated after confidence saturated")
+
+    # 0.50 (age) + 0.20 + 0.20 + 0.15 already exceeds 1.0.
+    confidence = compute_confidence(
+        stale, 1.2, _Untouchable(), _Untouchable(), _Untouchable(), now=now
+    )
+    assert confidence == 0.0
+
+
+def test_history_stdevs_match_population_stdev():
+    start = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    history = [
+        _make_observation(start + timedelta(minutes=i)).model_copy(
+            update={
+                "soil_moisture_p1": 0.2 + 0.05 * (i % 7),
+                "air_temperature": 18.0 + 1.5 * (i % 5),
+                "air_humidity": 40.0 + 3.0 * (i % 11),
+            }
+        )
+        for i in range(50)
+    ]
+
+    soil_std, temp_std, humidity_std = _history_stdevs(history)
+
+    assert soil_std == pytest.approx(pstdev(o.soil_moisture_p1 for o in history))
+    assert temp_std == pytest.approx(pstdev(o.air_temperature for o in history))
+    assert humidity_std == pytest.approx(pstdev(o.air_humidity for o in history))
+    assert _history_stdevs(history[:1]) is None
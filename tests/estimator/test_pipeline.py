@@ -1,6 +1,6 @@
 ﻿"""Tests for estimator pipeline."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from brain.contracts import DeviceStatusV1, ObservationV1
 from brain.estimator.pipeline import EstimatorPipeline
@@ -67,3 +67,26 @@ def test_pipeline_is_deterministic_for_same_inputs():
     assert [a.model_dump() for a in result_a[2]] == [
         b.model_dump() for b in result_b[2]
     ]
+
+
+def test_process_batch_matches_serial_processing():
+    start = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    items = []
+    for i in range(12):
+        ts = start + timedelta(minutes=5 * i)
+        obs = _make_observation(ts).model_copy(update={"soil_moisture_p1": 0.30 - 0.02 * i})
+        items.append((obs, _device_status(ts)))
+
+    serial = EstimatorPipeline()
+    expected = [serial.process(obs, device) for obs, device in items]
+    batched = EstimatorPipeline().process_batch(iter(items))
+
+    def _dump(result):
+        state, anomalies, sensor_health = result
+        return (
+            state.model_dump(),
+            [a.model_dump() for a in anomalies],
+            [h.model_dump() for h in sensor_health],
+        )
+
+    assert [_dump(r) for r in batched] == [_dump(r) for r in expected]
@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from statistics import mean, pstdev
+
+import pytest
 
 from brain.estimator.ring_buffer import TimeRingBuffer
 
@@ -21,6 +24,19 @@ def test_ring_buffer_overwrites_oldest():
     assert buffer.items()[0].value == 2.0
 
 
+def test_items_is_live_view_and_snapshot_is_detached():
+    buffer = TimeRingBuffer(1.0, lambda item: item.timestamp)
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    buffer.append(Sample(now, 1.0))
+    view = buffer.items()
+    snapshot = buffer.snapshot()
+
+    buffer.append(Sample(now + timedelta(minutes=1), 2.0))
+
+    assert [item.value for item in view] == [1.0, 2.0]
+    assert [item.value for item in snapshot] == [1.0]
+
+
 def test_get_last_n_hours():
     buffer = TimeRingBuffer(5.0, lambda item: item.timestamp)
     now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
@@ -32,6 +48,23 @@ def test_get_last_n_hours():
     assert [item.value for item in last_hour] == [2.0, 3.0]
 
 
+def test_index_since_bisects_on_timestamp():
+    buffer = TimeRingBuffer(5.0, lambda item: item.timestamp)
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    for minutes in (90, 60, 30, 0):
+        buffer.append(Sample(now - timedelta(minutes=minutes), float(minutes)))
+
+    assert buffer.index_since(now - timedelta(hours=3)) == 0
+    assert buffer.index_since(now - timedelta(minutes=60)) == 1
+    assert buffer.index_since(now - timedelta(minutes=45)) == 2
+    assert buffer.index_since(now + timedelta(seconds=1)) == 4
+    assert [item.value for item in buffer.get_since(now - timedelta(minutes=60))] == [
+        60.0,
+        30.0,
+        0.0,
+    ]
+
+
 def test_get_stats():
     buffer = TimeRingBuffer(5.0, lambda item: item.timestamp)
     now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
@@ -45,3 +78,24 @@ def test_get_stats():
     assert stats.maximum == 5.0
     assert stats.mean == 3.0
     assert stats.std is not None and stats.std > 0
+
+
+def test_get_stats_matches_statistics_module():
+    buffer = TimeRingBuffer(5.0, lambda item: item.timestamp)
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    values = [0.42, 0.40, 0.47, 0.31, 0.55, 0.38]
+    for i, value in enumerate(values):
+        buffer.append(Sample(now + timedelta(minutes=i), value))
+
+    stats = buffer.get_stats(lambda item: item.value)
+    assert stats.count == len(values)
+    assert stats.minimum == min(values)
+    assert stats.maximum == max(values)
+    assert stats.mean == pytest.approx(mean(values))
+    assert stats.std == pytest.approx(pstdev(values))
+
+    single = TimeRingBuffer(5.0, lambda item: item.timestamp)
+    single.append(Sample(now, 2.5))
+    assert single.get_stats(lambda item: item.value).std == 0.0
+    empty = TimeRingBuffer(5.0, lambda item: item.timestamp)
+    assert empty.get_stats(lambda item: item.value).mean is None
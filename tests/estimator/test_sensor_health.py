@@ -1,5 +1,6 @@
 ﻿"""Tests for sensor health fault detection."""
 
+from collections import deque
 from datetime import datetime, timedelta, timezone
 
 from brain.contracts import ObservationV1
@@ -61,3 +62,21 @@ def test_fault_detection_drift():
     health = evaluate_sensor_health(current, history)
     soil_health = _get_sensor(health, "soil_moisture_p1")
     assert soil_health.fault_state in {FaultType.DRIFT, FaultType.JUMP}
+
+
+def test_history_views_give_identical_health():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    history = [
+        _make_obs(now - timedelta(hours=6), 0.40),
+        _make_obs(now - timedelta(hours=3), 0.42),
+        _make_obs(now - timedelta(minutes=45), 0.44),
+        _make_obs(now - timedelta(minutes=5), 0.45),
+    ]
+    current = _make_obs(now, 0.46)
+
+    def _dump(results):
+        return [h.model_dump() for h in results]
+
+    expected = _dump(evaluate_sensor_health(current, history))
+    assert _dump(evaluate_sensor_health(current, history + [current])) == expected
+    assert _dump(evaluate_sensor_health(current, deque(history + [current]))) == expected
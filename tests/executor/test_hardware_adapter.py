@@ -11,6 +11,7 @@ from brain.executor import (
     HardwareStubAdapter,
     available_hardware_adapters,
     create_hardware_adapter,
+    get_hardware_adapter_factory,
     register_hardware_adapter,
 )
 
@@ -35,6 +36,30 @@ def test_dispatch_maps_action_to_expected_command():
     assert result.adapter_name == "hardware_stub"
 
 
+@pytest.mark.parametrize("adapter_name", ["hardware_stub", "production_scaffold"])
+def test_dispatch_resolves_every_action_type(adapter_name):
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    adapter = create_hardware_adapter(adapter_name)
+    for action_type in ActionType:
+        trusted = ActionV1.build_trusted(
+            schema_version="action_v1",
+            timestamp=now,
+            action_type=action_type.value,
+            reason="test",
+        )
+        validated = ActionV1(
+            schema_version="action_v1",
+            timestamp=now,
+            action_type=action_type,
+            reason="test",
+        )
+        commands = {
+            adapter.dispatch(action=action, now=now).command for action in (trusted, validated)
+        }
+        assert len(commands) == 1
+        assert not commands.pop().endswith("UNKNOWN")
+
+
 def test_create_adapter_supports_production_scaffold():
     adapter = create_hardware_adapter("production_scaffold")
     assert adapter.adapter_name == "production_scaffold"
@@ -61,9 +86,12 @@ def test_register_hardware_adapter_allows_custom_factory():
                 details=now.isoformat(),
             )
 
+    before = available_hardware_adapters()
     register_hardware_adapter("custom_adapter", _CustomAdapter)
     adapter = create_hardware_adapter("custom_adapter")
     assert adapter.adapter_name == "custom_adapter"
+    assert "custom_adapter" in available_hardware_adapters()
+    assert available_hardware_adapters() == tuple(sorted({*before, "custom_adapter"}))
 
 
 def test_dispatch_result_validates_required_fields():
@@ -81,6 +109,11 @@ def test_dispatch_result_validates_required_fields():
     assert isinstance(result, HardwareDispatchResult)
 
 
+def test_adapter_lookup_normalizes_names():
+    assert get_hardware_adapter_factory(" Hardware_Stub ") is HardwareStubAdapter
+    assert get_hardware_adapter_factory("hardware_stub") is HardwareStubAdapter
+
+
 def test_unknown_adapter_name_raises_value_error():
     with pytest.raises(ValueError):
         create_hardware_adapter("missing_adapter")
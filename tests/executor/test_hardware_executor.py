@@ -2,6 +2,8 @@
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from brain.contracts import ActionV1, DeviceStatusV1, GuardrailResultV1
 from brain.contracts.action_v1 import ActionType
 from brain.contracts.guardrail_result_v1 import (
@@ -148,6 +150,21 @@ def test_marks_event_skipped_when_adapter_rejects():
     )
 
 
+def test_rejects_naive_execution_time():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    executor = HardwareExecutor(HardwareStubAdapter())
+    action = _action(now)
+
+    with pytest.raises(ValueError, match="timezone-aware"):
+        executor.execute(
+            proposed_action=action,
+            effective_action=action,
+            guardrail_result=_guardrail(now, GuardrailDecision.APPROVED),
+            now=now.replace(tzinfo=None),
+            device_status=_device_status(now),
+        )
+
+
 def test_blocks_execution_when_telemetry_is_missing():
     now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
     executor = HardwareExecutor(HardwareStubAdapter())
@@ -169,6 +186,32 @@ def test_blocks_execution_when_telemetry_is_missing():
     assert transitions[0].notes == "state_transition:nominal->faulted:telemetry_missing"
 
 
+def test_drained_events_are_detached_from_later_queueing():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    executor = HardwareExecutor(create_hardware_adapter("flaky_stub"))
+    action = _action(now)
+    result = _guardrail(now, GuardrailDecision.APPROVED)
+
+    def run(at: datetime) -> None:
+        executor.execute(
+            proposed_action=action,
+            effective_action=action,
+            guardrail_result=result,
+            now=at,
+            device_status=_device_status(at),
+        )
+
+    run(now)
+    drained = executor.drain_runtime_events()
+    count = len(drained)
+    run(now + timedelta(minutes=1))
+
+    assert count > 0
+    assert len(drained) == count
+    assert executor.drain_runtime_events()
+    assert executor.drain_runtime_events() == []
+
+
 def test_retries_retryable_failure_then_executes():
     class _FlakyThenSuccessAdapter:
         def __init__(self) -> None:
@@ -219,6 +262,82 @@ def test_retries_retryable_failure_then_executes():
     )
 
 
+def test_retry_backoff_schedule_follows_policy_until_exhausted():
+    class _AlwaysTransientAdapter:
+        adapter_name = "always_transient"
+
+        def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
+            return HardwareDispatchResult(
+                accepted=False,
+                command="TEMP_FAIL",
+                duration_seconds=action.duration_seconds,
+                adapter_name=self.adapter_name,
+                retryable=True,
+                error_class="transient_io",
+            )
+
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    policy = RetryPolicyConfig(max_attempts=4, base_backoff_seconds=5.0, max_backoff_seconds=15.0)
+    executor = HardwareExecutor(_AlwaysTransientAdapter(), retry_policy=policy)
+    action = _action(now)
+
+    event = executor.execute(
+        proposed_action=action,
+        effective_action=action,
+        guardrail_result=_guardrail(now, GuardrailDecision.APPROVED),
+        now=now,
+        device_status=_device_status(now),
+    )
+    scheduled = [
+        e.notes for e in executor.drain_runtime_events() if e.notes.startswith("retry_scheduled:")
+    ]
+
+    assert [note.split(":")[3] for note in scheduled] == [
+        "backoff_seconds=5.000",
+        "backoff_seconds=10.000",
+        "backoff_seconds=15.000",
+    ]
+    assert event.timestamp == now + timedelta(seconds=30)
+
+
+def test_retries_past_the_capped_backoff_reuse_it():
+    class _AlwaysTransientAdapter:
+        adapter_name = "always_transient"
+
+        def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
+            return HardwareDispatchResult(
+                accepted=False,
+                command="TEMP_FAIL",
+                duration_seconds=action.duration_seconds,
+                adapter_name=self.adapter_name,
+                retryable=True,
+                error_class="transient_io",
+            )
+
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    policy = RetryPolicyConfig(max_attempts=4, base_backoff_seconds=5.0, max_backoff_seconds=10.0)
+    executor = HardwareExecutor(_AlwaysTransientAdapter(), retry_policy=policy)
+    action = _action(now)
+
+    event = executor.execute(
+        proposed_action=action,
+        effective_action=action,
+        guardrail_result=_guardrail(now, GuardrailDecision.APPROVED),
+        now=now,
+        device_status=_device_status(now),
+    )
+
+    assert policy.backoff_table == (5.0, 10.0)
+    assert event.timestamp == now + timedelta(seconds=25)
+    assert event.notes.endswith("attempts=4")
+
+
+def test_large_retry_budget_constructs_executor():
+    policy = RetryPolicyConfig(max_attempts=1100)
+    executor = HardwareExecutor(HardwareStubAdapter(), retry_policy=policy)
+    assert executor.drain_runtime_events() == []
+
+
 def test_non_retryable_failure_fails_fast_with_reason_code():
     class _NonRetryableAdapter:
         @property
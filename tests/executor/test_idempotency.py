@@ -152,3 +152,57 @@ def test_missing_key_keeps_backward_compatible_behavior():
     assert first.status == "executed"
     assert second.status == "executed"
     assert adapter.calls == 2
+
+
+def _run(executor: HardwareExecutor, action: ActionV1, at: datetime):
+    return executor.execute(
+        proposed_action=action,
+        effective_action=action,
+        guardrail_result=_guardrail(at),
+        now=at,
+        device_status=_device_status(at),
+    )
+
+
+def test_full_cache_evicts_oldest_entry():
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    adapter = _CountingAdapter()
+    executor = HardwareExecutor(adapter, idempotency=IdempotencyConfig(max_entries=2))
+
+    for minute, key in enumerate(("idem-key-a", "idem-key-b", "idem-key-c")):
+        _run(executor, _action(now, key=key), now + timedelta(minutes=minute))
+
+    repeat_c = _run(executor, _action(now, key="idem-key-c"), now + timedelta(minutes=3))
+    repeat_a = _run(executor, _action(now, key="idem-key-a"), now + timedelta(minutes=4))
+
+    assert repeat_c.status == "skipped"
+    assert repeat_a.status == "executed"
+    assert adapter.calls == 4
+
+
+def test_expired_entry_behind_a_retried_one_is_not_reused():
+    class _RetryFirstKeyAdapter(_CountingAdapter):
+        def dispatch(self, *, action: ActionV1, now: datetime) -> HardwareDispatchResult:
+            if action.idempotency_key == "idem-retried" and self.calls == 0:
+                self.calls += 1
+                return HardwareDispatchResult(
+                    accepted=False,
+                    command="TEMP_FAIL",
+                    duration_seconds=action.duration_seconds,
+                    adapter_name=self.adapter_name,
+                    retryable=True,
+                    error_class="transient_io",
+                )
+            return super().dispatch(action=action, now=now)
+
+    now = datetime(2026, 2, 15, 0, 0, tzinfo=timezone.utc)
+    adapter = _RetryFirstKeyAdapter()
+    executor = HardwareExecutor(adapter, idempotency=IdempotencyConfig(ttl_seconds=60))
+
+    # Stored at now+30s (after one backoff), ahead of "idem-plain" stored at now+10s.
+    _run(executor, _action(now, key="idem-retried"), now)
+    _run(executor, _action(now, key="idem-plain"), now + timedelta(seconds=10))
+
+    late = now + timedelta(seconds=80)
+    assert _run(executor, _action(now, key="idem-plain"), late).status == "executed"
+    assert _run(executor, _action(now, key="idem-retried"), late).status == "skipped"
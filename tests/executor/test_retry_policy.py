@@ -1,5 +1,8 @@
 """Tests for deterministic retry/backoff policy."""
 
+import math
+from dataclasses import asdict
+
 import pytest
 
 from brain.executor import RetryPolicyConfig
@@ -17,11 +20,48 @@ def test_backoff_sequence_is_deterministic():
     assert policy.backoff_seconds_for_retry(3) == 25.0
 
 
+def test_capped_backoff_is_reused_for_later_retries():
+    policy = RetryPolicyConfig(
+        max_attempts=4,
+        base_backoff_seconds=10.0,
+        backoff_multiplier=2.0,
+        max_backoff_seconds=25.0,
+    )
+    assert policy.backoff_table == (10.0, 20.0, 25.0)
+    assert policy.backoff_seconds_for_retry(9) == 25.0
+    with pytest.raises(ValueError):
+        policy.backoff_seconds_for_retry(0)
+
+
+def test_large_attempt_budget_builds_and_stays_capped():
+    policy = RetryPolicyConfig(max_attempts=1100)
+    assert policy.backoff_seconds_for_retry(1099) == policy.max_backoff_seconds
+    uncapped = RetryPolicyConfig(max_attempts=1100, max_backoff_seconds=math.inf)
+    assert uncapped.backoff_seconds_for_retry(3) == 120.0
+
+
+def test_list_retryable_classes_still_back_off():
+    policy = RetryPolicyConfig(retryable_error_classes=["timeout"])
+    assert policy.is_retryable_error_class("timeout") is True
+    assert policy.backoff_seconds_for_retry(1) == 30.0
+
+
+def test_derived_lookups_are_not_dataclass_state():
+    assert asdict(RetryPolicyConfig()) == {
+        "max_attempts": 3,
+        "base_backoff_seconds": 30.0,
+        "backoff_multiplier": 2.0,
+        "max_backoff_seconds": 300.0,
+        "retryable_error_classes": ("transient_io", "timeout", "transport_unavailable"),
+    }
+
+
 def test_retryable_error_class_membership():
     policy = RetryPolicyConfig(retryable_error_classes=("timeout", "transient_io"))
     assert policy.is_retryable_error_class("timeout") is True
     assert policy.is_retryable_error_class("fatal_config") is False
     assert policy.is_retryable_error_class(None) is False
+    assert policy.retryable_error_classes == ("timeout", "transient_io")
 
 
 def test_invalid_policy_configuration_raises():
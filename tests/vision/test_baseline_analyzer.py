@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from brain.contracts import VisionInputV1
+from brain.contracts import VisionExplanationV1, VisionInputV1
 from brain.vision import BaselineVisionAnalyzer
 
 
@@ -42,3 +42,10 @@ def test_analyzer_emits_unknown_for_low_confidence_context():
     assert vision.plant_status == "unknown"
     assert vision.confidence == 0.4
     assert "Insufficient confidence" in explanation.summary
+
+
+def test_trusted_explanation_passes_full_validation():
+    analyzer = BaselineVisionAnalyzer()
+    _, explanation = analyzer.analyze(_input("vpd=1.40 soil_avg_pct=36.0 conf=0.90"))
+    restored = VisionExplanationV1.model_validate_json(explanation.model_dump_json())
+    assert restored == explanation
@@ -97,6 +97,41 @@ def test_weather_adapter_noop_window_keeps_base_targets():
     assert result.sampling_plan.overrides == []
 
 
+def test_weather_adapter_nan_temperature_does_not_mask_later_extremes():
+    base_ts = datetime(2026, 2, 15, 1, 0, tzinfo=timezone.utc)
+    forecast = _forecast(
+        [
+            ForecastPointV1(
+                timestamp=base_ts,
+                ext_temp_c=float("nan"),
+                ext_rh_pct=55.0,
+                ext_wind_mps=3.0,
+                ext_cloud_cover_pct=40.0,
+            ),
+            ForecastPointV1(
+                timestamp=base_ts + timedelta(hours=1),
+                ext_temp_c=33.0,
+                ext_rh_pct=55.0,
+                ext_wind_mps=3.0,
+                ext_cloud_cover_pct=20.0,
+            ),
+            ForecastPointV1(
+                timestamp=base_ts + timedelta(hours=2),
+                ext_temp_c=-2.0,
+                ext_rh_pct=55.0,
+                ext_wind_mps=3.0,
+                ext_cloud_cover_pct=45.0,
+            ),
+        ]
+    )
+    adapter = WeatherAdapter()
+    state_input = map_state_v1_to_weather_adapter_input(_state())
+
+    result = adapter.apply(forecast, state_input)
+
+    assert result.targets.active_scenarios == ["heatwave", "cold_spell"]
+
+
 def test_weather_adapter_is_deterministic_for_identical_inputs():
     base_ts = datetime(2026, 2, 15, 1, 0, tzinfo=timezone.utc)
     forecast = _forecast(